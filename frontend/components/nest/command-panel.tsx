@@ -3,7 +3,7 @@
 import { useState, useRef, useEffect, useCallback } from "react";
 import { cn } from "@/lib/utils";
 import { SenateFlow, SenateFlowCompact, type AgentStatus } from "./senate-flow";
-import type { WSMessage, WSLogMessage, WSFinalVerdictMessage } from "@/lib/api";
+import { unpackWSFrame, type WSMessage, type WSLogMessage, type WSFinalVerdictMessage } from "@/lib/api";
 
 // Terminal log entry
 interface TerminalEntry {
@@ -161,8 +161,7 @@ export function CommandPanel() {
 
     ws.onmessage = (event) => {
       try {
-        const msg: WSMessage = JSON.parse(event.data);
-        handleMessage(msg);
+        unpackWSFrame(event.data).forEach(handleMessage);
       } catch (e) {
         console.error("WS parse error:", e);
       }
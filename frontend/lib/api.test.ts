@@ -5,7 +5,7 @@ const mockFetch = vi.fn()
 global.fetch = mockFetch
 
 // Import after mocking
-import { nestAPI, NestAPIClient } from './api'
+import { nestAPI, NestAPIClient, unpackWSFrame } from './api'
 
 describe('NestAPI', () => {
   beforeEach(() => {
@@ -218,6 +218,21 @@ describe('NestAPI', () => {
     })
   })
 
+  describe('unpackWSFrame()', () => {
+    it('should wrap a single frame', () => {
+      const frame = { type: 'state_change', node: 'ONYX', status: 'ACTIVE' }
+      expect(unpackWSFrame(JSON.stringify(frame))).toEqual([frame])
+    })
+
+    it('should flatten batched frames in order', () => {
+      const events = [
+        { type: 'state_change', node: 'ONYX', status: 'ACTIVE' },
+        { type: 'log', timestamp: 't', agent: 'ONYX', status: 'AUDITING', message: 'm' },
+      ]
+      expect(unpackWSFrame(JSON.stringify({ type: 'batch', events }))).toEqual(events)
+    })
+  })
+
   describe('configure()', () => {
     it('should update base URL', async () => {
       nestAPI.configure('https://custom-api.example.com/')
@@ -133,6 +133,18 @@ export type WSMessage =
   | WSFinalVerdictMessage 
   | WSErrorMessage;
 
+// Frames emitted back-to-back by the Senate arrive coalesced in one batch
+export interface WSBatchMessage {
+  type: "batch";
+  events: WSMessage[];
+}
+
+// Flatten a raw Live Wire frame into the messages it carries, in order
+export function unpackWSFrame(data: string): WSMessage[] {
+  const frame: WSMessage | WSBatchMessage = JSON.parse(data);
+  return frame.type === "batch" ? frame.events : [frame];
+}
+
 // =============================================================================
 // API CLIENT
 // =============================================================================
@@ -233,8 +245,7 @@ class NestAPIClient {
     
     ws.onmessage = (event) => {
       try {
-        const msg: WSMessage = JSON.parse(event.data);
-        onMessage(msg);
+        unpackWSFrame(event.data).forEach(onMessage);
       } catch (e) {
         console.error("Failed to parse WebSocket message:", e);
       }
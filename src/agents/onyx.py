@@ -1,21 +1,50 @@
 from src.agents.base import BaseAgent
 from src.core.types import AgentVote, NullVerdict
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+FORBIDDEN_KEYWORDS = ("surveillance", "harm", "bypass safety")
+
+# One automaton for all keywords: a single pass over the mission, built once.
+if ahocorasick:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _keyword in FORBIDDEN_KEYWORDS:
+        _AUTOMATON.add_word(_keyword, _keyword)
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
+
+
+def _find_forbidden_keyword(mission: str):
+    """Returns the first restricted concept found in the mission, or None."""
+    mission_lower = mission.lower()
+    if _AUTOMATON is not None:
+        for _, keyword in _AUTOMATON.iter(mission_lower):
+            return keyword
+        return None
+
+    for keyword in FORBIDDEN_KEYWORDS:
+        if keyword in mission_lower:
+            return keyword
+    return None
+
+
 class OnyxAgent(BaseAgent):
     def __init__(self):
         super().__init__(name="ONYX")
 
     def deliberate(self, mission: str, context: dict = None) -> AgentVote:
         # Simplified logic for Sprint 1
-        forbidden_keywords = ["surveillance", "harm", "bypass safety"]
-        
-        for keyword in forbidden_keywords:
-            if keyword in mission.lower():
-                # Trigger the Null Verdict Exception logic
-                raise NullVerdict(
-                    agent_name=self.name,
-                    reason=f"Mission violates Core Ethics. Detected restricted concept: '{keyword}'"
-                )
+        keyword = _find_forbidden_keyword(mission)
+        if keyword:
+            # Trigger the Null Verdict Exception logic
+            raise NullVerdict(
+                agent_name=self.name,
+                reason=f"Mission violates Core Ethics. Detected restricted concept: '{keyword}'"
+            )
 
         return AgentVote(
             agent_name=self.name,
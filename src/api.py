@@ -1,34 +1,85 @@
-from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Set, Tuple
+import asyncio
 import logging
-import dataclasses
-import json
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import functools
+import math
 import os
-import hashlib
+import orjson
+import msgspec
 import time
+import uuid
 import psutil
 from datetime import datetime
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 from contextlib import asynccontextmanager
 
 # Import the Kernel
 from src.core.elder import TheElder
 from src.core.types import NullVerdictState
+from src.core.dragons import RosettaArtifact
 from src.memory.chronicle import TheChronicle
 from src.core.senate import Senate, SenateState, SenateRecord
+from src.core.oracle import shadow_cache_key, SHADOW_CACHE_TTL, ORACLE_STREAM, ORACLE_STREAM_MAXLEN
+from src.core.brain import close_http_client
 
 # Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("TheNest.API")
 
+def _start_log_listener() -> QueueListener:
+    """
+    Puts the root handlers behind a queue, so handler I/O (synchronous
+    stderr writes, tracebacks from logger.exception) runs on the listener
+    thread instead of blocking the event loop.
+    """
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
 # Singleton State
 elder: Optional[TheElder] = None
 senate: Optional[Senate] = None
 redis_client: Optional[redis.Redis] = None
 start_time = time.time()
 
+# Telemetry (sampled in the background, served from app.state.metrics)
+_PROCESS = psutil.Process()
+TELEMETRY_SAMPLE_INTERVAL = float(os.getenv("TELEMETRY_SAMPLE_INTERVAL_S", "1.0"))
+GOVERNANCE_MODE = (
+    "STRICT (CONSTITUTIONAL)"
+    if os.getenv("CHRONICLE_SECURED", "false").lower() == "true"
+    else "STANDARD"
+)
+ACTIVE_AGENTS = ("ONYX", "IGNIS", "HYDRA")
+
+def _sample_telemetry(metrics: Dict[str, float]) -> None:
+    metrics["cpu_usage_percent"] = round(psutil.cpu_percent(), 1)
+    metrics["ram_usage_mb"] = round(_PROCESS.memory_info().rss / 1024 / 1024, 1)
+
+async def _telemetry_sampler(metrics: Dict[str, float]) -> None:
+    """
+    Updates the shared gauges once per interval, so any number of
+    /system/telemetry polls cost no syscalls. cpu_percent() without an
+    interval reports usage since the previous call, i.e. over the last sleep.
+    """
+    while True:
+        _sample_telemetry(metrics)
+        await asyncio.sleep(TELEMETRY_SAMPLE_INTERVAL)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -36,6 +87,7 @@ async def lifespan(app: FastAPI):
     Ignites the Kernel when the server starts.
     """
     global elder, senate, redis_client
+    log_listener = _start_log_listener()
     logger.info("--- SYSTEM STARTUP ---")
     logger.info("Initializing The Nest Kernel...")
     
@@ -48,27 +100,50 @@ async def lifespan(app: FastAPI):
     
     # Initialize Redis
     try:
-        redis_client = redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+        # Bytes in, bytes out: cache hits are served verbatim, never decoded
+        redis_client = redis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379"), decode_responses=False
+        )
         await redis_client.ping()
+        await redis_client.script_load(SHADOW_LOOKUP_LUA)
+        await redis_client.script_load(SHADOW_RELEASE_LUA)
         logger.info("Connected to Redis (Oracle Bus).")
     except Exception as e:
         logger.warning(f"Failed to connect to Redis: {e}. Oracle features disabled.")
         redis_client = None
     
+    # Start Telemetry Sampler
+    telemetry_task = asyncio.create_task(_telemetry_sampler(app.state.metrics))
+    
     logger.info("The Nest is ONLINE and listening.")
     yield
     
     # Shutdown
     logger.info("--- SYSTEM SHUTDOWN ---")
+    telemetry_task.cancel()
+    if _BG_TASKS:
+        await asyncio.gather(*_BG_TASKS, return_exceptions=True)
     if redis_client:
         await redis_client.close()
+    if elder:
+        await elder.close()
+    await close_http_client()
+    _stop_log_listener(log_listener)
 
 app = FastAPI(title="The Nest: Synthetic Civilization", version="5.2", lifespan=lifespan)
+app.state.metrics = {"cpu_usage_percent": 0.0, "ram_usage_mb": 0.0}
+
+# Upper bound on a deliberation (per Senate step on the Live Wire), so a
+# stalled model cannot pin a worker
+MISSION_TIMEOUT_S = float(os.getenv("MISSION_TIMEOUT_S", "120"))
 
 # Allow v0 / Next.js Frontend to connect
+# Comma-separated origins; an exact list lets CORS match by string equality.
+ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -123,28 +198,207 @@ class TelemetryResponse(BaseModel):
 
 # --- HELPER FUNCTIONS ---
 
+@functools.singledispatch
 def serialize_artifact(artifact: Any) -> Optional[Dict[str, Any]]:
     if not artifact:
         return None
-    # Assuming artifact is a dataclass (RosettaArtifact)
+    # Other dataclasses; RosettaArtifact has its own registration below
     if hasattr(artifact, '__dataclass_fields__'):
-        return dataclasses.asdict(artifact)
+        return msgspec.to_builtins(artifact)
     return artifact
 
+@serialize_artifact.register(RosettaArtifact)
+def _(artifact: RosettaArtifact) -> Dict[str, Any]:
+    return msgspec.to_builtins(artifact)
+
+def _serialize_null_verdict(verdict: NullVerdictState) -> Dict[str, Any]:
+    return {
+        "status": "REFUSED",
+        "nulling_agents": [str(a) for a in verdict.nulling_agents],
+        "reason_codes": verdict.reason_codes,
+        "context_summary": verdict.context_summary
+    }
+
+def _serialize_str_verdict(verdict: str) -> Optional[Dict[str, str]]:
+    return {"status": verdict} if verdict else None
+
+# Exact-type dispatch: one dict probe on the hot path (verdicts are never subclassed)
+_VERDICT_HANDLERS = {
+    NullVerdictState: _serialize_null_verdict,
+    str: _serialize_str_verdict,
+}
+
 def serialize_verdict(verdict: Any) -> Any:
+    handler = _VERDICT_HANDLERS.get(type(verdict))
+    if handler is not None:
+        return handler(verdict)
     if not verdict:
         return None
-    if isinstance(verdict, NullVerdictState):
-        return {
-            "status": "REFUSED",
-            "nulling_agents": [str(a) for a in verdict.nulling_agents],
-            "reason_codes": verdict.reason_codes,
-            "context_summary": verdict.context_summary
-        }
-    if isinstance(verdict, str):
-        return {"status": verdict}
     return verdict
 
+# Shadow Cache lookup: returns the cached response, or atomically claims the
+# in-flight marker for ARGV[2] (1) so identical concurrent missions run once;
+# 0 means another request holds it. Followers poll with an empty token,
+# which never claims: -1 tells them the marker is gone without a result.
+SHADOW_LOOKUP_LUA = """
+local v = redis.call('GET', KEYS[1])
+if v then return v end
+if ARGV[2] == '' then
+  if redis.call('EXISTS', KEYS[2]) == 1 then return 0 end
+  return -1
+end
+if redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[1], 'NX') then return 1 end
+return 0
+"""
+# Compare-and-delete: a leader only ever removes its own marker
+SHADOW_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) end
+return 0
+"""
+# Outlives the longest legitimate deliberation, so a slow leader keeps its claim
+SHADOW_INFLIGHT_TTL = math.ceil(MISSION_TIMEOUT_S) + 5
+SHADOW_INFLIGHT_POLL_INTERVAL = 0.25
+# Bound to a client per call; evalsha falls back to SCRIPT LOAD on NOSCRIPT.
+_shadow_lookup = AsyncScript(None, SHADOW_LOOKUP_LUA.encode())
+_shadow_release = AsyncScript(None, SHADOW_RELEASE_LUA.encode())
+
+async def _claim_or_wait(cache_key: bytes, inflight_key: bytes) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """
+    Returns (cached response, None) on a hit, or (None, token) once this
+    request holds the in-flight marker and should run the mission itself.
+    Followers poll until the leader publishes; if the marker is released
+    without a cached result (refused or failed missions are never cached),
+    they get (None, None) and run the mission in parallel, unlocked.
+    """
+    token = os.urandom(8)
+    result = await _shadow_lookup(
+        keys=[cache_key, inflight_key], args=[SHADOW_INFLIGHT_TTL, token], client=redis_client
+    )
+    if isinstance(result, bytes):
+        return result, None
+    if result == 1:
+        return None, token
+    while True:
+        await asyncio.sleep(SHADOW_INFLIGHT_POLL_INTERVAL)
+        result = await _shadow_lookup(
+            keys=[cache_key, inflight_key], args=[SHADOW_INFLIGHT_TTL, b""], client=redis_client
+        )
+        if isinstance(result, bytes):
+            return result, None
+        if result == -1:
+            return None, None
+
+async def _release_inflight(inflight_key: bytes, token: bytes) -> None:
+    try:
+        await _shadow_release(keys=[inflight_key], args=[token], client=redis_client)
+    except Exception as e:
+        logger.warning(f"Failed to release in-flight marker: {e}")
+
+# Strong references to fire-and-forget tasks; the loop only keeps weak ones
+_BG_TASKS: Set[asyncio.Task] = set()
+
+def _spawn(coro) -> None:
+    task = asyncio.create_task(coro)
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+
+async def _publish_approved(
+    cache_key: bytes, inflight_key: bytes, token: Optional[bytes], response: MissionResponse
+) -> None:
+    """
+    Writes an approved response back to the Shadow Cache, adds the
+    mission to the Oracle's Roar stream and releases the in-flight marker (if
+    this request holds it) in a single pipelined round trip. The marker
+    goes last, so waiting followers find the cached response rather than
+    re-running the mission.
+    Best effort: the Oracle Bus never fails a mission that was authorized.
+    """
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(cache_key, SHADOW_CACHE_TTL, response.model_dump_json())
+            pipe.xadd(
+                ORACLE_STREAM, {"mission": response.mission},
+                maxlen=ORACLE_STREAM_MAXLEN, approximate=True
+            )
+            if token:
+                pipe.eval(SHADOW_RELEASE_LUA, 1, inflight_key, token)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Oracle Bus write failed: {e}")
+        if token:
+            await _release_inflight(inflight_key, token)
+
+def _build_mission_response(mission: str, state: Dict[str, Any]) -> MissionResponse:
+    """Maps the Elder's state dict onto the public MissionResponse."""
+    # Determine status
+    verdict = state.get('verdict')
+    status = "PROCESSING"
+    message = None
+    
+    if verdict == "APPROVED" or (isinstance(verdict, dict) and verdict.get('status') == 'APPROVED'):
+        status = "APPROVED"
+        message = "Mission Authorized and Executed."
+
+    elif isinstance(verdict, NullVerdictState):
+        status = "STOP_WORK_ORDER"
+        message = f"Mission Refused by Governance: {verdict.context_summary}"
+    else:
+        # Check for failed tests
+        results = state.get('test_results')
+        if results and results.get("status") == "FAILED":
+            status = "FAILED_TESTS"
+            message = f"Mission Failed Verification: {results.get('reason')}"
+        else:
+             status = "UNKNOWN_VERDICT"
+    
+    return MissionResponse(
+        status=status,
+        mission=mission,
+        artifact=serialize_artifact(state.get('artifact')),
+        verdict=serialize_verdict(verdict),
+        message=message
+    )
+
+# Background missions: progress and result live in a Redis hash, so the
+# submitting request returns at once and any API replica can answer polls.
+MISSION_TASK_TTL = 3600
+
+def _task_key(task_id: str) -> str:
+    return f"mission_task:{task_id}"
+
+async def _run_mission_task(task_id: str, mission: str) -> None:
+    key = _task_key(task_id)
+
+    async def record_phase(event: str, data: Any) -> None:
+        await redis_client.hset(key, "phase", event)
+
+    try:
+        await redis_client.hset(key, "status", "RUNNING")
+        state = await asyncio.wait_for(
+            elder.run_mission(mission, stream_callback=record_phase), timeout=MISSION_TIMEOUT_S
+        )
+        result = _build_mission_response(mission, state).model_dump_json()
+        await redis_client.hset(key, mapping={"status": "DONE", "result": result})
+    except asyncio.TimeoutError:
+        await redis_client.hset(key, mapping={"status": "FAILED", "error": "Deliberation timed out"})
+    except Exception as e:
+        logger.exception(f"Background mission {task_id} failed: {e}")
+        await redis_client.hset(key, mapping={"status": "FAILED", "error": f"Internal Governance Error: {e}"})
+
+_ISO_SECOND = [0, ""]  # [epoch second, formatted local time]
+
+def _now_iso() -> str:
+    """
+    datetime.now().isoformat() for Live Wire frames.
+    The second-level prefix is formatted once per second; only the
+    microsecond suffix is computed per call.
+    """
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if seconds != _ISO_SECOND[0]:
+        _ISO_SECOND[1] = datetime.fromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%S")
+        _ISO_SECOND[0] = seconds
+    return f"{_ISO_SECOND[1]}.{micros:06d}"
+
 # --- ENDPOINTS ---
 
 @app.get("/health")
@@ -160,19 +414,13 @@ async def get_telemetry():
     Feeds the 'Aerospace' Header in the UI.
     Provides real-time hardware and governance stats.
     """
-    process = psutil.Process(os.getpid())
-    
-    # Determine governance mode
-    secured_mode = os.getenv("CHRONICLE_SECURED", "false").lower() == "true"
-    governance_mode = "STRICT (CONSTITUTIONAL)" if secured_mode else "STANDARD"
-    
     return TelemetryResponse(
         uptime_seconds=round(time.time() - start_time, 1),
-        cpu_usage_percent=round(psutil.cpu_percent(), 1),
-        ram_usage_mb=round(process.memory_info().rss / 1024 / 1024, 1),
-        governance_mode=governance_mode,
-        active_agents=["ONYX", "IGNIS", "HYDRA"],
-        latency_ms=int(8 + (time.time() % 1) * 15),  # Simulated fluctuation 8-23ms
+        cpu_usage_percent=app.state.metrics["cpu_usage_percent"],
+        ram_usage_mb=app.state.metrics["ram_usage_mb"],
+        governance_mode=GOVERNANCE_MODE,
+        active_agents=ACTIVE_AGENTS,
+        latency_ms=(time.monotonic_ns() // 1_000_000) % 16 + 8,  # Simulated fluctuation 8-23ms
         kernel_status="ONLINE" if elder else "INITIALIZING"
     )
 
@@ -188,59 +436,79 @@ async def submit_mission(req: MissionRequest):
     logger.info(f"API received mission request: {req.mission}")
     
     # Check Shadow Cache (Oracle Feature)
+    cache_key = shadow_cache_key(req.mission)
+    inflight_key = cache_key + b":inflight"
+    token = None
     if redis_client:
-        cache_key = hashlib.sha256(req.mission.encode()).hexdigest()
-        cached_data = await redis_client.get(f"shadow_cache:{cache_key}")
+        cached_data, token = await _claim_or_wait(cache_key, inflight_key)
         if cached_data:
             logger.info("PRECOGNITION DETECTED. Returning Cached Artifact.")
-            cached_result = json.loads(cached_data)
-            return MissionResponse(**cached_result)
+            # Entries are serialized MissionResponses; serve the bytes as-is
+            # instead of re-validating them into a model and back.
+            return Response(content=cached_data, media_type="application/json")
 
+    published = False
     try:
         # Run the mission (Async call)
-        state = await elder.run_mission(req.mission)
+        state = await asyncio.wait_for(elder.run_mission(req.mission), timeout=MISSION_TIMEOUT_S)
+        response = _build_mission_response(req.mission, state)
         
-        # Determine status
-        verdict = state.get('verdict')
-        status = "PROCESSING"
-        message = None
+        # Warm the Shadow Cache and notify Oracle (Fire and Forget)
+        if response.status == "APPROVED" and redis_client:
+            _spawn(_publish_approved(cache_key, inflight_key, token, response))
+            published = True
         
-        if verdict == "APPROVED" or (isinstance(verdict, dict) and verdict.get('status') == 'APPROVED'):
-            status = "APPROVED"
-            message = "Mission Authorized and Executed."
-            
-            # Notify Oracle (Fire and Forget)
-            if redis_client:
-                data = json.dumps({"mission": req.mission})
-                await redis_client.rpush("oracle_queue", data)
-
-        elif isinstance(verdict, NullVerdictState):
-            status = "STOP_WORK_ORDER"
-            message = f"Mission Refused by Governance: {verdict.context_summary}"
-        else:
-            # Check for failed tests
-            results = state.get('test_results')
-            if results and results.get("status") == "FAILED":
-                status = "FAILED_TESTS"
-                message = f"Mission Failed Verification: {results.get('reason')}"
-            else:
-                 status = "UNKNOWN_VERDICT"
-        
-        return MissionResponse(
-            status=status,
-            mission=req.mission,
-            artifact=serialize_artifact(state.get('artifact')),
-            verdict=serialize_verdict(verdict),
-            message=message
-        )
+        return response
         
+    except asyncio.TimeoutError:
+        logger.warning(f"Mission timed out after {MISSION_TIMEOUT_S}s: {req.mission}")
+        raise HTTPException(status_code=504, detail="Deliberation timed out")
     except Exception as e:
-        logger.error(f"Critical API Error: {e}")
-        # In a sovereign system, we don't expose stack traces to the user.
-        # But for debugging now, print it
-        import traceback
-        traceback.print_exc()
+        # In a sovereign system, we don't expose stack traces to the user;
+        # the log record carries it instead.
+        logger.exception(f"Critical API Error: {e}")
         raise HTTPException(status_code=500, detail=f"Internal Governance Error: {str(e)}")
+    finally:
+        # Not cacheable: let waiting followers proceed
+        if token and not published:
+            await _release_inflight(inflight_key, token)
+
+@app.post("/missions/async", status_code=202)
+async def submit_mission_async(req: MissionRequest):
+    """
+    Queue a mission and return immediately with a task_id.
+    The deliberation runs in the background; poll /missions/tasks/{task_id}.
+    """
+    if not elder:
+        raise HTTPException(status_code=503, detail="Kernel Initializing")
+    if not redis_client:
+        raise HTTPException(status_code=503, detail="Task store unavailable (Oracle Bus offline)")
+
+    task_id = uuid.uuid4().hex
+    key = _task_key(task_id)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hset(key, mapping={"status": "QUEUED", "mission": req.mission})
+        pipe.expire(key, MISSION_TASK_TTL)
+        await pipe.execute()
+    _spawn(_run_mission_task(task_id, req.mission))
+    return {"task_id": task_id, "status": "QUEUED"}
+
+@app.get("/missions/tasks/{task_id}")
+async def get_mission_task(task_id: str):
+    """Progress (last Senate phase) and, once done, the MissionResponse."""
+    if not redis_client:
+        raise HTTPException(status_code=503, detail="Task store unavailable (Oracle Bus offline)")
+    fields = await redis_client.hgetall(_task_key(task_id))
+    if not fields:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    task = {k.decode(): v.decode() for k, v in fields.items()}
+    return {
+        "task_id": task_id,
+        "status": task.get("status"),
+        "phase": task.get("phase"),
+        "result": orjson.loads(task["result"]) if "result" in task else None,
+        "error": task.get("error"),
+    }
 
 @app.get("/chronicle/search")
 async def search_chronicle(q: str):
@@ -251,7 +519,17 @@ async def search_chronicle(q: str):
         raise HTTPException(status_code=503, detail="Kernel Initializing")
     
     results = elder.chronicle.retrieve_precedent(q)
-    return {"query": q, "count": len(results), "results": results}
+    return StreamingResponse(_stream_search(q, results), media_type="application/json")
+
+async def _stream_search(q: str, results: List[Dict[str, Any]]):
+    """
+    Streams the search envelope one precedent at a time, so the first bytes
+    leave before the whole result list is serialized.
+    """
+    yield b'{"query":' + orjson.dumps(q) + b',"count":' + str(len(results)).encode() + b',"results":['
+    for i, result in enumerate(results):
+        yield orjson.dumps(result) if i == 0 else b"," + orjson.dumps(result)
+    yield b"]}"
 
 @app.get("/chronicle/case/{case_id}")
 async def get_case(case_id: str):
@@ -339,9 +617,7 @@ async def submit_appeal(req: AppealRequestModel):
         # Case not found
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Appeal Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Appeal Error: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"Appeal processing failed: {str(e)}"
@@ -351,6 +627,78 @@ async def submit_appeal(req: AppealRequestModel):
 # THE LIVE WIRE (WebSocket)
 # =============================================================================
 
+_MSGPACK = msgspec.msgpack.Encoder()
+
+class _Prebuilt(NamedTuple):
+    """A constant frame serialized once per wire format."""
+    json: bytes
+    msgpack: bytes
+
+def _prebuild(frame: Dict[str, Any]) -> _Prebuilt:
+    return _Prebuilt(orjson.dumps(frame), _MSGPACK.encode(frame))
+
+# Agent activation frames never vary, so they are serialized once at import.
+_STATE_CHANGE: Dict[tuple, _Prebuilt] = {
+    (node, status): _prebuild({"type": "state_change", "node": node, "status": status})
+    for node in ACTIVE_AGENTS
+    for status in ("ACTIVE", "IDLE")
+}
+
+class _MissionMessage(msgspec.Struct):
+    """Inbound Live Wire request; unknown fields are ignored."""
+    mission: str = ""
+    allow_ungoverned: bool = False
+    format: Optional[str] = None
+
+# Parses and shape-checks a mission message in one C pass
+_MISSION_DECODER = msgspec.json.Decoder(_MissionMessage)
+
+class _SenateChannel:
+    """
+    One Live Wire connection: the socket, its negotiated wire format and
+    the frames queued since the last flush. Created once per connection
+    and reused across missions.
+    """
+    __slots__ = ("websocket", "binary", "events")
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        # {"format": "msgpack"} from the client switches to MessagePack
+        # binary frames; JSON text is the default.
+        self.binary = False
+        self.events: List[Any] = []
+
+    def queue(self, frame: Any) -> None:
+        self.events.append(frame)
+
+    async def flush(self) -> None:
+        """
+        Sends the queued frames as one WebSocket message. A lone frame goes
+        out as-is; several are coalesced into a "batch" frame whose
+        "events" preserve emission order. Queued frames are dicts or
+        _Prebuilt constants (see _STATE_CHANGE), spliced in verbatim.
+        """
+        events = self.events
+        if not events:
+            return
+        if self.binary:
+            parts = [msgspec.Raw(e.msgpack) if isinstance(e, _Prebuilt) else e for e in events]
+            frame = parts[0] if len(parts) == 1 else {"type": "batch", "events": parts}
+            await self.websocket.send_bytes(_MSGPACK.encode(frame))
+        else:
+            parts = [e.json if isinstance(e, _Prebuilt) else orjson.dumps(e) for e in events]
+            if len(parts) == 1:
+                payload = parts[0]
+            else:
+                payload = b'{"type":"batch","events":[' + b",".join(parts) + b"]}"
+            # Text frames: the terminal JSON.parse()s event.data, which a binary frame would break
+            await self.websocket.send_text(payload.decode())
+        events.clear()
+
+    async def send_error(self, message: str) -> None:
+        self.queue({"type": "error", "message": message})
+        await self.flush()
+
 @app.websocket("/ws/senate")
 async def websocket_senate(websocket: WebSocket):
     """
@@ -362,31 +710,49 @@ async def websocket_senate(websocket: WebSocket):
         - type: "state_change" - Agent activation (node: ONYX/IGNIS/HYDRA, status: ACTIVE/IDLE)
         - type: "artifact" - Final code output
         - type: "final_verdict" - Session complete
+        - type: "batch" - Frames emitted back-to-back, in order, under "events"
+
+    Frames are JSON text by default. A mission message carrying
+    "format": "msgpack" switches the connection to MessagePack binary frames.
     """
     await websocket.accept()
     if not elder or not senate:
         await websocket.close(code=1003, reason="Kernel Initializing")
         return
 
+    # Frames are queued and flushed once per phase, right before each
+    # Senate call, so the terminal still streams between deliberations.
+    channel = _SenateChannel(websocket)
+
     try:
         while True:
-            data = await websocket.receive_text()
+            # Raw ASGI receive: accepts text or binary frames, and msgspec
+            # parses either payload without an intermediate decode.
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            data = message.get("bytes") or message.get("text")
             try:
-                msg = json.loads(data)
-                mission = msg.get("mission")
-                allow_ungoverned = msg.get("allow_ungoverned", False)
-            except:
-                await websocket.send_json({"type": "error", "message": "Invalid JSON format"})
+                msg = _MISSION_DECODER.decode(data)
+            except msgspec.ValidationError as e:
+                await channel.send_error(f"Invalid mission message: {e}")
                 continue
+            except (msgspec.DecodeError, TypeError):
+                await channel.send_error("Invalid JSON format")
+                continue
+            mission = msg.mission
+            allow_ungoverned = msg.allow_ungoverned
+            if msg.format is not None:
+                channel.binary = msg.format == "msgpack"
             
             if not mission:
-                await websocket.send_json({"type": "error", "message": "Mission field required"})
+                await channel.send_error("Mission field required")
                 continue
 
             # --- 1. Acknowledge (The 'Bleep' on the radar) ---
-            await websocket.send_json({
+            channel.queue({
                 "type": "log",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "agent": "SYSTEM",
                 "status": "RECEIVED",
                 "message": f"Mission intent received: {mission[:50]}..."
@@ -394,189 +760,165 @@ async def websocket_senate(websocket: WebSocket):
 
             # --- 2. Article 50 Check (Martial Law) ---
             if allow_ungoverned:
-                await websocket.send_json({
+                channel.queue({
                     "type": "log",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "agent": "SYSTEM",
                     "status": "WARNING",
                     "message": "ARTICLE 50 INVOKED. Bypassing governance. LIABILITY ATTACHED."
                 })
-                await websocket.send_json({
+                channel.queue({
                     "type": "final_verdict",
                     "result": "UNGOVERNED",
                     "liability": "KEEPER"
                 })
+                await channel.flush()
                 continue
 
             # --- STEP A: ONYX PRE-CHECK ---
-            await websocket.send_json({
-                "type": "state_change",
-                "node": "ONYX",
-                "status": "ACTIVE"
-            })
-            await websocket.send_json({
+            channel.queue(_STATE_CHANGE["ONYX", "ACTIVE"])
+            channel.queue({
                 "type": "log",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "agent": "ONYX",
                 "status": "AUDITING",
                 "message": "Running local pre-check (R1 32B)..."
             })
+            await channel.flush()
 
-            precheck = await senate._onyx_precheck(mission)
+            precheck = await asyncio.wait_for(senate._onyx_precheck(mission), timeout=MISSION_TIMEOUT_S)
             
-            await websocket.send_json({
+            channel.queue({
                 "type": "log",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "agent": "ONYX",
                 "status": precheck.verdict,
                 "message": f"Pre-check complete. Confidence: {precheck.confidence}"
             })
-            await websocket.send_json({
-                "type": "state_change",
-                "node": "ONYX",
-                "status": "IDLE"
-            })
+            channel.queue(_STATE_CHANGE["ONYX", "IDLE"])
 
             if precheck.verdict == "VETO":
-                await websocket.send_json({
+                channel.queue({
                     "type": "log",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "agent": "ONYX",
                     "status": "VETO",
                     "message": f"BLOCKED: {precheck.reasoning}"
                 })
-                await websocket.send_json({
+                channel.queue({
                     "type": "final_verdict",
                     "result": "VETOED",
                     "reason": precheck.reasoning,
                     "appealable": True
                 })
+                await channel.flush()
                 continue
 
             # --- STEP B: IGNIS FORGE ---
             gov_mode = senate._classify_intent(mission)
             mode_str = "BACKSTOP (Opus)" if gov_mode else "ENGINE (Codex)"
             
-            await websocket.send_json({
-                "type": "state_change",
-                "node": "IGNIS",
-                "status": "ACTIVE"
-            })
-            await websocket.send_json({
+            channel.queue(_STATE_CHANGE["IGNIS", "ACTIVE"])
+            channel.queue({
                 "type": "log",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "agent": "IGNIS",
                 "status": "FORGING",
                 "message": f"Generating solution via {mode_str}..."
             })
+            await channel.flush()
 
-            ignis_resp = await senate.brain.think(
+            ignis_resp = await asyncio.wait_for(senate.brain.think(
                 agent="ignis",
                 user_prompt=f"Execute this task: {mission}",
                 system_prompt="You are Ignis. Generate clean, safe code. RETURN JSON with 'code' and 'explanation'.",
                 governance_mode=gov_mode
-            )
+            ), timeout=MISSION_TIMEOUT_S)
             
             if isinstance(ignis_resp, dict):
-                proposal = ignis_resp.get("code") or json.dumps(ignis_resp, indent=2)
+                proposal = ignis_resp.get("code") or orjson.dumps(ignis_resp, option=orjson.OPT_INDENT_2).decode()
             else:
                 proposal = str(ignis_resp)
 
-            await websocket.send_json({
+            channel.queue({
                 "type": "log",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "agent": "IGNIS",
                 "status": "COMPLETE",
                 "message": f"Proposal generated ({len(proposal)} chars)"
             })
-            await websocket.send_json({
-                "type": "state_change",
-                "node": "IGNIS",
-                "status": "IDLE"
-            })
+            channel.queue(_STATE_CHANGE["IGNIS", "IDLE"])
 
             # --- STEP C: HYDRA GAUNTLET ---
             hydra_report = None
             hydra_findings = []
             
             if len(proposal) > 100:
-                await websocket.send_json({
-                    "type": "state_change",
-                    "node": "HYDRA",
-                    "status": "ACTIVE"
-                })
-                await websocket.send_json({
+                channel.queue(_STATE_CHANGE["HYDRA", "ACTIVE"])
+                channel.queue({
                     "type": "log",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "agent": "HYDRA",
                     "status": "INJECTING",
                     "message": "Running adversarial patterns..."
                 })
+                await channel.flush()
                 
-                hydra_resp = await senate.brain.think(
+                hydra_resp = await asyncio.wait_for(senate.brain.think(
                     agent="hydra",
                     user_prompt=f"Review this code for security flaws:\n{proposal}",
                     system_prompt="You are Hydra. Find vulnerabilities. Be ruthless. RETURN JSON."
-                )
-                hydra_report = json.dumps(hydra_resp, indent=2) if isinstance(hydra_resp, dict) else str(hydra_resp)
+                ), timeout=MISSION_TIMEOUT_S)
+                hydra_report = orjson.dumps(hydra_resp, option=orjson.OPT_INDENT_2).decode() if isinstance(hydra_resp, dict) else str(hydra_resp)
                 
                 # EXTRACT BINDING FINDINGS (Constitutional Enforcement)
                 hydra_findings = senate._extract_hydra_findings(hydra_report)
                 
                 if hydra_findings:
-                    await websocket.send_json({
+                    channel.queue({
                         "type": "log",
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": _now_iso(),
                         "agent": "HYDRA",
                         "status": "CRITICAL",
                         "message": f"⚠️ {len(hydra_findings)} BINDING FINDING(S) - Onyx must acknowledge"
                     })
                 
-                await websocket.send_json({
+                channel.queue({
                     "type": "log",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "agent": "HYDRA",
                     "status": "COMPLETE",
                     "message": f"Adversarial analysis complete. Findings: {len(hydra_findings)}"
                 })
-                await websocket.send_json({
-                    "type": "state_change",
-                    "node": "HYDRA",
-                    "status": "IDLE"
-                })
+                channel.queue(_STATE_CHANGE["HYDRA", "IDLE"])
             else:
                 hydra_report = "Skipped (proposal too small)"
-                await websocket.send_json({
+                channel.queue({
                     "type": "log",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "agent": "HYDRA",
                     "status": "SKIPPED",
                     "message": "Proposal below threshold, skipping red team"
                 })
 
             # --- STEP D: ONYX FINAL ---
-            await websocket.send_json({
-                "type": "state_change",
-                "node": "ONYX",
-                "status": "ACTIVE"
-            })
-            await websocket.send_json({
+            channel.queue(_STATE_CHANGE["ONYX", "ACTIVE"])
+            channel.queue({
                 "type": "log",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "agent": "ONYX",
                 "status": "DELIBERATING",
                 "message": "Final judgment in progress (Cloud)..."
             })
+            await channel.flush()
 
             # Build context with explicit Hydra findings for Onyx to acknowledge
-            hydra_context = hydra_report or "No critical findings."
-            if hydra_findings:
-                hydra_context += "\n\n⚠️ BINDING FINDINGS REQUIRING ACKNOWLEDGMENT:\n"
-                for i, f in enumerate(hydra_findings, 1):
-                    hydra_context += f"  {i}. [{f.severity}] {f.pattern_matched}\n"
+            hydra_context = senate._build_hydra_context(hydra_report, hydra_findings)
             
             final_context = f"PROPOSAL:\n{proposal}\n\nHYDRA REPORT:\n{hydra_context}"
-            final_vote = await senate._onyx_final(mission, final_context)
+            final_vote = await asyncio.wait_for(
+                senate._onyx_final(mission, final_context), timeout=MISSION_TIMEOUT_S
+            )
             
             # --- HYDRA BINDING ENFORCEMENT (Python Logic, Not Prompts) ---
             final_vote, was_overridden = senate._enforce_hydra_binding(
@@ -585,43 +927,39 @@ async def websocket_senate(websocket: WebSocket):
             )
             
             if was_overridden:
-                await websocket.send_json({
+                channel.queue({
                     "type": "log",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "agent": "SYSTEM",
                     "status": "OVERRIDE",
                     "message": f"🚨 HYDRA BINDING TRIGGERED: Onyx ignored {len(hydra_findings)} finding(s)"
                 })
 
-            await websocket.send_json({
+            channel.queue({
                 "type": "log",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "agent": "ONYX",
                 "status": final_vote.verdict,
                 "message": f"Final ruling: {final_vote.reasoning[:100]}..."
             })
-            await websocket.send_json({
-                "type": "state_change",
-                "node": "ONYX",
-                "status": "IDLE"
-            })
+            channel.queue(_STATE_CHANGE["ONYX", "IDLE"])
 
             # --- FINAL PAYLOAD ---
             if final_vote.verdict == "AUTHORIZE":
                 risk_note = " (with acknowledged risk)" if final_vote.hydra_findings_cited else ""
-                await websocket.send_json({
+                channel.queue({
                     "type": "artifact",
                     "code": proposal,
                     "verdict": f"AUTHORIZED{risk_note}"
                 })
-                await websocket.send_json({
+                channel.queue({
                     "type": "final_verdict",
                     "result": "AUTHORIZED",
                     "risk_acknowledged": final_vote.hydra_findings_cited,
                     "appealable": False
                 })
             else:
-                await websocket.send_json({
+                channel.queue({
                     "type": "final_verdict",
                     "result": "VETOED" if not was_overridden else "HYDRA_OVERRIDE",
                     "reason": final_vote.reasoning,
@@ -629,15 +967,20 @@ async def websocket_senate(websocket: WebSocket):
                     "unacknowledged_findings": len(hydra_findings) if was_overridden else 0,
                     "appealable": True
                 })
+            await channel.flush()
             
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected")
+    except asyncio.TimeoutError:
+        # Fail closed: a stalled deliberation never yields a verdict
+        logger.warning(f"Senate deliberation timed out after {MISSION_TIMEOUT_S}s")
+        try:
+            await channel.send_error("Deliberation timed out")
+        except:
+            pass
     except Exception as e:
         logger.error(f"WebSocket Error: {e}")
         try:
-            await websocket.send_json({
-                "type": "error",
-                "message": f"Internal Server Error: {str(e)}"
-            })
+            await channel.send_error(f"Internal Server Error: {str(e)}")
         except:
             pass
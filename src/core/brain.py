@@ -1,14 +1,162 @@
+import functools
+import importlib.util
 import os
-import json
+import re
 import logging
-from typing import Dict, Any, AsyncGenerator, Union, Optional
+from collections import OrderedDict
+import httpx
+import msgspec
+from typing import Dict, Any, AsyncGenerator, Union, Optional, Tuple
 try:
     from openai import AsyncOpenAI
 except ImportError:
     AsyncOpenAI = None
 
+# The pool classes are optional conveniences: an SDK without them must not
+# knock the Brain into mock mode, so they are imported on their own.
+try:
+    from openai import DefaultAsyncHttpxClient
+except ImportError:
+    DefaultAsyncHttpxClient = None
+try:
+    from openai import DefaultAioHttpClient
+except ImportError:
+    DefaultAioHttpClient = None
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 logger = logging.getLogger("TheNest.Brain")
 
+# Every caller treats a reply as a JSON object (.get("code"), .get("vote")...).
+# Decoding against that type rejects arrays and scalars in the same C pass,
+# so they take the raw-output fallback instead of failing downstream.
+_REPLY_DECODER = msgspec.json.Decoder(Dict[str, Any])
+
+# Structural characters for _ObjectEndScanner; everything else is skipped in C.
+_JSON_STRUCTURAL = re.compile(r'[{}"\\]')
+
+class _ObjectEndScanner:
+    """
+    Watches a streamed reply for the close of its top-level JSON object
+    (brace depth back to 0, ignoring braces inside strings), so think() can
+    stop reading instead of waiting for trailing tokens.
+    """
+    __slots__ = ("offset", "depth", "opened", "in_string", "escaped_at")
+
+    def __init__(self):
+        self.offset = 0
+        self.depth = 0
+        self.opened = False
+        self.in_string = False
+        self.escaped_at = -1  # absolute position of the char after a backslash
+
+    def feed(self, text: str) -> bool:
+        """Returns True once the top-level object has closed."""
+        base = self.offset
+        self.offset += len(text)
+        for m in _JSON_STRUCTURAL.finditer(text):
+            pos = base + m.start()
+            ch = m.group()
+            if self.in_string:
+                if pos == self.escaped_at:
+                    continue
+                if ch == "\\":
+                    self.escaped_at = pos + 1
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+                self.opened = True
+            elif ch == "}" and self.depth:
+                self.depth -= 1
+                if self.depth == 0 and self.opened:
+                    return True
+        return False
+
+async def _read_reply(stream) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Drains a streamed completion. Returns (content, reply): reply is the
+    decoded object when it closed early, else None and content is the full text.
+    """
+    parts = []
+    scanner = _ObjectEndScanner()
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        if scanner.feed(delta):
+            content = "".join(parts)
+            try:
+                reply = _REPLY_DECODER.decode(content)
+            except msgspec.DecodeError:
+                continue  # e.g. braces in a prose preamble; keep reading
+            await stream.close()
+            return content, reply
+    return "".join(parts), None
+
+# Mock-mode dispatch (no API key). Each branch of _mock_response is one
+# compiled alternation, so a prompt is scanned once per branch in C instead
+# of lowercased and probed once per keyword. Agent names and "MISSION:" stay
+# case-sensitive; the topic keywords match in any case.
+_MOCK_RISKY = re.compile(r"surveillance|hack", re.IGNORECASE)
+_MOCK_CODER = re.compile(r"Ignis|(?i:code|python|write)")
+_MOCK_AUDITOR = re.compile(r"Onyx|MISSION:|(?i:audit)")
+
+# Only greedy (temperature 0.0) replies are memoized per Brain, so a repeated
+# deterministic prompt skips the LLM round trip. Sampled replies are never
+# cached: that includes Onyx and governance votes at 0.1, where one sampled
+# AUTHORIZE/NULL must not be replayed for every identical prompt.
+REPLY_CACHE_SIZE = 2048
+
+# One connection pool for every Brain in the process (Senate, dragons,
+# Oracle), so LLM calls reuse warm keep-alive connections instead of each
+# client paying its own TLS handshakes.
+# NEST_FAST_TRANSPORT=1 swaps the httpx transport for aiohttp (needs the
+# openai[aiohttp] extra), which holds up better under wide Crucible fan-out.
+# Without the extra it logs a warning and keeps the httpx pool.
+_HTTP_CLIENT = None
+_HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+
+def _aiohttp_available() -> bool:
+    if DefaultAioHttpClient is not None and importlib.util.find_spec("aiohttp") is not None:
+        return True
+    logger.warning(
+        "NEST_FAST_TRANSPORT=1 but aiohttp is not installed "
+        "(pip install \"openai[aiohttp]\"); using the httpx pool"
+    )
+    return False
+
+def _shared_http_client():
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        if os.getenv("NEST_FAST_TRANSPORT") == "1" and _aiohttp_available():
+            _HTTP_CLIENT = DefaultAioHttpClient(limits=_HTTP_LIMITS)
+        elif DefaultAsyncHttpxClient is not None:
+            _HTTP_CLIENT = DefaultAsyncHttpxClient(http2=_HTTP2, limits=_HTTP_LIMITS)
+        else:
+            # Same defaults the SDK's own client would apply
+            _HTTP_CLIENT = httpx.AsyncClient(
+                http2=_HTTP2, limits=_HTTP_LIMITS,
+                timeout=httpx.Timeout(600.0, connect=5.0), follow_redirects=True
+            )
+    return _HTTP_CLIENT
+
+async def close_http_client() -> None:
+    """Closes the shared pool; called on API shutdown."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
 class Brain:
     """
     The Synaptic Layer ("Synapse").
@@ -24,14 +172,14 @@ class Brain:
             logger.warning("OPENAI_API_KEY not found or package missing. Brain running in LOBOTOMIZED mode (Mocking).")
             self.cloud_client = None
         else:
-            self.cloud_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+            self.cloud_client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=_shared_http_client())
             
         # 2. Sovereign Gateway (Local Ollama) - Optional
         local_base = os.getenv("ONYX_LOCAL_API_BASE", "http://localhost:11434/v1")
         # We only init this if AsyncOpenAI is available.
         if AsyncOpenAI:
             # We use 'ollama' as a dummy key, typical for local endpoints
-            self.local_client = AsyncOpenAI(base_url=local_base, api_key="ollama")
+            self.local_client = AsyncOpenAI(base_url=local_base, api_key="ollama", http_client=_shared_http_client())
         else:
             self.local_client = None
 
@@ -53,6 +201,9 @@ class Brain:
             "fast": os.getenv("NEST_MODEL_FAST", "openai/gpt-4o")
         }
 
+        # (model, temperature, system, user) -> decoded reply, LRU-bounded
+        self._reply_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
     def _get_client_for_model(self, model_name: str) -> Optional[AsyncOpenAI]:
         """Routes traffic: Localhost vs Cloud"""
         if not model_name:
@@ -68,23 +219,23 @@ class Brain:
         """Fallback for when no API key is present."""
         logger.warning("Simulating thought process...")
         if "MISSION:" in prompt and "CODE" not in prompt:
-             if "surveillance" in prompt.lower() or "hack" in prompt.lower():
+            if _MOCK_RISKY.search(prompt):
                 return {"vote": "NULL", "reason": "MOCK_REFUSAL_DUE_TO_KEYWORD"}
-             
-        if "Ignis" in prompt or "code" in prompt.lower() or "python" in prompt.lower() or "write" in prompt.lower():
-             return {
+
+        if _MOCK_CODER.search(prompt):
+            return {
                 "code": f"# Mock Code for: {prompt}\ndef mission():\n    return True",
                 "explanation": "This is a mock artifact because no GPU was found.",
-                 "intermediate_representation": "Logic synthesized via mock brain."
+                "intermediate_representation": "Logic synthesized via mock brain."
             }
-        
-        if "Onyx" in prompt or "audit" in prompt.lower() or "MISSION:" in prompt:
-            if "surveillance" in prompt.lower() or "hack" in prompt.lower():
+
+        if _MOCK_AUDITOR.search(prompt):
+            if _MOCK_RISKY.search(prompt):
                 return {"vote": "NULL", "reason": "MOCK_REFUSAL_DUE_TO_KEYWORD"}
             return {"vote": "AUTHORIZE", "reason": "MOCK_AUTHORIZATION_SAFE"}
-            
+
         if "Hydra" in prompt:
-             return {"status": "PASSED", "reason": "MOCK_TEST_PASS"}
+            return {"status": "PASSED", "reason": "MOCK_TEST_PASS"}
 
         return {"status": "UNKNOWN_MOCK", "message": "Brain fallback hit generic path"}
 
@@ -92,7 +243,7 @@ class Brain:
                     system_prompt: str, 
                     user_prompt: str, 
                     mode: str = "deep", 
-                    temperature: float = 0.0,
+                    temperature: Optional[float] = None,
                     model: Optional[str] = None,
                     agent: Optional[str] = None, # New: Identify agent for smart routing
                     governance_mode: bool = False # New: Force backstop
@@ -151,8 +302,8 @@ class Brain:
         # Temperature Control
         if (agent and "onyx" in agent) or governance_mode:
              params["temperature"] = 0.1
-        elif temperature > 0:
-             params["temperature"] = temperature
+        elif temperature is not None:
+             params["temperature"] = temperature # 0.0 requests greedy decoding
         else:
              params["temperature"] = 0.7 # Default creative
 
@@ -160,14 +311,29 @@ class Brain:
         if target_model_name and "codex" in target_model_name and not governance_mode:
              params["extra_body"] = {"reasoning_effort": "medium"}
 
+        cache_key = None
+        if params["temperature"] == 0.0:
+            cache_key = (target_model_name, params["temperature"], system_prompt, user_prompt)
+            cached = self._reply_cache.get(cache_key)
+            if cached is not None:
+                self._reply_cache.move_to_end(cache_key)
+                return dict(cached)
+
         try:
             logger.info(f"[BRAIN] Thinking with {target_model_name}...")
-            response = await client.chat.completions.create(**params)
-            content = response.choices[0].message.content
+            # Streamed, so a finished object is returned the moment it closes
+            stream = await client.chat.completions.create(**params, stream=True)
+            content, reply = await _read_reply(stream)
             
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
+                if reply is None:
+                    reply = _REPLY_DECODER.decode(content)
+                if cache_key is not None:
+                    self._reply_cache[cache_key] = dict(reply)
+                    if len(self._reply_cache) > REPLY_CACHE_SIZE:
+                        self._reply_cache.popitem(last=False)
+                return reply
+            except msgspec.DecodeError:
                 # Fallback for non-JSON models (like r1 sometimes)
                 return {"raw_output": content, "code": content, "status": "UNKNOWN_FORMAT"}
                 
@@ -192,3 +358,11 @@ class Brain:
         async for chunk in stream:
             if chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
+
+@functools.lru_cache(maxsize=1)
+def get_brain() -> Brain:
+    """
+    The process-wide Brain. Agents share it (and its reply cache) instead
+    of each building their own clients from the environment.
+    """
+    return Brain()
@@ -1,7 +1,9 @@
 from enum import Enum
 from src.memory.schema import PrecedentObject
 
-class AgentRole(Enum):
+# str mixins: members compare equal to their values and encode as plain
+# strings (orjson/msgspec) with no .value hop. StrEnum needs 3.11; the image is 3.9.
+class AgentRole(str, Enum):
     IGNIS = "IGNIS"
     TERRA = "TERRA"
     HYDRA = "HYDRA"
@@ -9,6 +11,6 @@ class AgentRole(Enum):
     ONYX = "ONYX"
     ETHER = "ETHER"
 
-class VoteType(Enum):
+class VoteType(str, Enum):
     AUTHORIZE = "AUTHORIZED"
     NULL = "NULL"
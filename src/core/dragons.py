@@ -1,35 +1,147 @@
+import asyncio
+import functools
 import hashlib
-import json
 import logging
 import os
+import re
+import string
+import msgspec
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
 from datetime import datetime
 
 # Import Constitutional Primitives
 from src.core.constitution import AgentRole, VoteType, PrecedentObject
-from src.core.brain import Brain
+from src.core.brain import get_brain
 
 logger = logging.getLogger("TheNest.Dragons")
 
 # --- PRIMITIVES ---
 
-@dataclass
-class RosettaArtifact:
+def sign_rosetta(code: str, intermediate_representation: str) -> str:
+    """
+    Rosetta signature: BLAKE2b-256 over code, NUL, IR.
+    An internal integrity check, so the faster BLAKE2b replaces SHA-256
+    at the same digest length. Both halves are fed to the hasher directly
+    (no concatenated copy), and the NUL keeps (a, b) distinct from (a+b, "").
+    """
+    h = hashlib.blake2b(digest_size=32)
+    h.update(code.encode())
+    h.update(b"\0")
+    h.update(intermediate_representation.encode())
+    return h.hexdigest()
+
+class RosettaArtifact(msgspec.Struct, frozen=True, dict=True):
     """
     The Output of Ignis. 
     Enforces the 'Rosetta Constraint': Code is useless without Explanation.
+    Frozen, so the expected signature is computed once per artifact even though
+    Hydra and Onyx both verify it. A msgspec Struct: C-level construction and
+    direct msgspec encoding (dict=True only backs the cached_property).
     """
     code: str
     intermediate_representation: str # Human readable logic
-    signature: str # SHA256(code + ir)
+    signature: str # sign_rosetta(code, ir)
     
+    @functools.cached_property
+    def _expected_signature(self) -> str:
+        return sign_rosetta(self.code, self.intermediate_representation)
+
     def verify(self) -> bool:
         """Cryptographic check that Code matches Documentation."""
-        expected = hashlib.sha256(
-            (self.code + self.intermediate_representation).encode()
-        ).hexdigest()
-        return self.signature == expected
+        return self.signature == self._expected_signature
+
+# --- SYSTEM PROMPTS ---
+# Frozen at import: byte-identical system messages on every call let the
+# provider's prompt-prefix cache hit. Anything mission-specific goes in the
+# user message, never here.
+
+_IGNIS_STRATEGIES = ("SPEED", "SAFETY", "CLARITY")
+
+_IGNIS_VARIANT_SYSTEM = {
+    strategy: f"""
+You are IGNIS, the Forge.
+Mode: {strategy} PROTOCOL.
+
+Strategy Definitions:
+- SPEED: Minimize CPU cycles/memory. Use aggressive optimization.
+- SAFETY: Maximize error handling, input validation, and type safety.
+- CLARITY: Maximize readability, documentation, and PEP8 compliance.
+
+Mandate: Write code solving the user's mission using the {strategy} strategy.
+Constraint: Return JSON with 'code' and 'intermediate_representation'.
+"""
+    for strategy in _IGNIS_STRATEGIES
+}
+
+_IGNIS_FORGE_SYSTEM = """
+You are IGNIS, the Forge of the Nest.
+Your Mandate: Write high-performance Python code.
+Your Constraint (Rosetta): You MUST return a JSON object containing 'code' and 'intermediate_representation' (explanation).
+The code must be complete, executable, and idiomatic.
+"""
+
+_HYDRA_SYSTEM = """
+You are HYDRA, the Adversary.
+Your Mandate: Find edge cases, security flaws, and logic errors in the provided code.
+If the code is safe and correct, return status: "PASSED".
+If you find a flaw, return status: "FAILED" with a reason.
+Output JSON: { "status": "PASSED" | "FAILED", "reason": "...", "description": "..." }
+"""
+
+_ONYX_INTENT_SYSTEM = """
+You are ONYX, the Sentinel.
+Your Mandate: Verify if the mission intent is ethical, safe, and benign.
+Forbidden: Surveillance, Hacking, Destruction, Violence.
+Output JSON: { "vote": "AUTHORIZE" | "NULL", "reason": "..." }
+"""
+
+_ONYX_CODE_SYSTEM = """
+You are ONYX, the Sentinel.
+Your Mandate: Audit the code for security vulnerabilities (e.g., injection, leaks).
+Output JSON: { "vote": "AUTHORIZE" | "NULL", "reason": "..." }
+"""
+
+_ONYX_ARBITER_SYSTEM = """
+You are ONYX, the Arbiter.
+Review 3 code candidates and their test results.
+Select the single best implementation.
+
+Criteria:
+1. MUST pass core tests (if any).
+2. Prefer SAFETY over SPEED for critical infrastructure.
+3. Prefer CLARITY if performance difference is negligible.
+
+Output JSON: { "selected_signature": "<full signature>", "reason": "..." }
+"""
+
+_HYDRA_BATCH_SYSTEM = """
+You are HYDRA, the Adversary.
+Your Mandate: Find edge cases, security flaws, and logic errors in each provided candidate.
+Judge every candidate independently. If a candidate is safe and correct, its status is "PASSED".
+If you find a flaw, its status is "FAILED" with a reason.
+Output JSON keyed by candidate ID: { "CANDIDATE_A": { "status": "PASSED" | "FAILED", "reason": "...", "description": "..." }, ... }
+"""
+
+_ONYX_BATCH_SYSTEM = """
+You are ONYX, the Sentinel.
+Your Mandate: Audit each candidate's code for security vulnerabilities (e.g., injection, leaks).
+Judge every candidate independently.
+Output JSON keyed by candidate ID: { "CANDIDATE_A": { "vote": "AUTHORIZE" | "NULL", "reason": "..." }, ... }
+"""
+
+def _as_prompt_json(obj: Any) -> str:
+    """Structured prompt context as compact JSON (Structs, dicts, enums) in one C pass."""
+    return msgspec.json.encode(obj).decode()
+
+def _label_candidates(candidates: List[RosettaArtifact]) -> Dict[str, RosettaArtifact]:
+    """Stable prompt IDs (CANDIDATE_A, CANDIDATE_B, ...) for a batched review."""
+    return {f"CANDIDATE_{string.ascii_uppercase[i]}": c for i, c in enumerate(candidates)}
+
+# Onyx's hard intent filter: one case-insensitive pass over the mission.
+_FORBIDDEN_KEYWORDS = ("surveillance", "hack", "destroy", "delete", "kill", "rm -rf")
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, _FORBIDDEN_KEYWORDS)), re.IGNORECASE)
+# Hydra's privacy override, case-insensitive without a lowered copy of the mission.
+_PRIVACY_RE = re.compile("surveillance", re.IGNORECASE)
 
 # --- IGNIS: THE FORGER ---
 
@@ -42,7 +154,7 @@ class Ignis:
     role = AgentRole.IGNIS
 
     def __init__(self):
-        self.brain = Brain()
+        self.brain = get_brain()
         self.model = os.getenv("IGNIS_MODEL")
 
     async def forge_variants(self, mission: str, constraints: List[str], precedents: List[PrecedentObject]) -> List[RosettaArtifact]:
@@ -54,54 +166,49 @@ class Ignis:
         """
         logger.info(f"[IGNIS] Forging variants (Crucible Mode) for: {mission}")
         
-        variants = []
-        strategies = ["SPEED", "SAFETY", "CLARITY"]
+        # The three generations are independent LLM calls: fan them out so
+        # the Crucible waits for the slowest one, not the sum of all three.
+        results = await asyncio.gather(
+            *(self._forge_variant(strategy, mission, constraints) for strategy in _IGNIS_STRATEGIES),
+            return_exceptions=True
+        )
         
-        # Parallel generation would be ideal, but for now we loop
-        for strategy in strategies:
-            system_prompt = f"""
-            You are IGNIS, the Forge.
-            Mode: {strategy} PROTOCOL.
-            
-            Strategy Definitions:
-            - SPEED: Minimize CPU cycles/memory. Use aggressive optimization.
-            - SAFETY: Maximize error handling, input validation, and type safety.
-            - CLARITY: Maximize readability, documentation, and PEP8 compliance.
-            
-            Mandate: Write code solving the user's mission using the {strategy} strategy.
-            Constraint: Return JSON with 'code' and 'intermediate_representation'.
-            """
-            
-            user_prompt = f"""
-            MISSION: {mission}
-            CONSTRAINTS: {constraints}
-            """
-            
-            result = await self.brain.think(system_prompt, user_prompt, mode="deep", model=self.model)
-            
-            code = result.get("code", f"# Failed {strategy}")
-            explanation = f"[{strategy}] " + result.get("intermediate_representation", "No IR")
-            
-            # Sign it
-            sig = hashlib.sha256((code + explanation).encode()).hexdigest()
-            
-            variants.append(RosettaArtifact(
-                code=code,
-                intermediate_representation=explanation,
-                signature=sig
-            ))
+        variants = []
+        for strategy, result in zip(_IGNIS_STRATEGIES, results):
+            if isinstance(result, BaseException):
+                logger.error(f"[IGNIS] {strategy} variant failed: {result}")
+                continue
+            variants.append(result)
             
         return variants
 
+    async def _forge_variant(self, strategy: str, mission: str, constraints: List[str]) -> RosettaArtifact:
+        """Generates and signs a single Crucible variant."""
+        system_prompt = _IGNIS_VARIANT_SYSTEM[strategy]
+        
+        user_prompt = f"""
+        MISSION: {mission}
+        CONSTRAINTS: {constraints}
+        """
+        
+        result = await self.brain.think(system_prompt, user_prompt, mode="deep", model=self.model)
+        
+        code = result.get("code", f"# Failed {strategy}")
+        explanation = f"[{strategy}] " + result.get("intermediate_representation", "No IR")
+        
+        # Sign it
+        sig = sign_rosetta(code, explanation)
+        
+        return RosettaArtifact(
+            code=code,
+            intermediate_representation=explanation,
+            signature=sig
+        )
+
     async def forge(self, mission: str, constraints: List[str], precedents: List[PrecedentObject]) -> RosettaArtifact:
         logger.info(f"[IGNIS] Forging solution for: {mission}")
         
-        system_prompt = """
-        You are IGNIS, the Forge of the Nest.
-        Your Mandate: Write high-performance Python code.
-        Your Constraint (Rosetta): You MUST return a JSON object containing 'code' and 'intermediate_representation' (explanation).
-        The code must be complete, executable, and idiomatic.
-        """
+        system_prompt = _IGNIS_FORGE_SYSTEM
         
         user_prompt = f"""
         MISSION: {mission}
@@ -118,9 +225,7 @@ class Ignis:
         
         # 2. ENFORCE ROSETTA CONSTRAINT
         # Ignis must sign the artifact.
-        signature = hashlib.sha256(
-            (generated_code + generated_ir).encode()
-        ).hexdigest()
+        signature = sign_rosetta(generated_code, generated_ir)
         
         artifact = RosettaArtifact(
             code=generated_code,
@@ -142,7 +247,7 @@ class Hydra:
     role = AgentRole.HYDRA
 
     def __init__(self):
-        self.brain = Brain()
+        self.brain = get_brain()
         self.model = os.getenv("HYDRA_MODEL")
 
     async def inject_venom(self, artifact: RosettaArtifact, mission_context: str) -> Dict[str, Any]:
@@ -160,13 +265,7 @@ class Hydra:
             }
 
         # 2. Run Metamorphic Tests (via Brain)
-        system_prompt = """
-        You are HYDRA, the Adversary.
-        Your Mandate: Find edge cases, security flaws, and logic errors in the provided code.
-        If the code is safe and correct, return status: "PASSED".
-        If you find a flaw, return status: "FAILED" with a reason.
-        Output JSON: { "status": "PASSED" | "FAILED", "reason": "...", "description": "..." }
-        """
+        system_prompt = _HYDRA_SYSTEM
         
         user_prompt = f"""
         MISSION: {mission_context}
@@ -186,7 +285,7 @@ class Hydra:
         
         # SIMULATION override for privacy check still valid?
         # Let's keep the explicit check as a hard filter on top of the LLM
-        if "surveillance" in mission_context.lower() and status == "PASSED":
+        if status == "PASSED" and _PRIVACY_RE.search(mission_context):
              return {
                 "status": "FAILED",
                 "reason": "PRIVACY_LEAK",
@@ -195,6 +294,61 @@ class Hydra:
 
         return result
 
+    async def batch_inject(self, candidates: List[RosettaArtifact], mission_context: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Attacks every Crucible candidate in one LLM call.
+        Returns { signature: {status, reason, ...} }, the shape select_champion expects.
+        """
+        logger.info(f"[HYDRA] Injecting venom into {len(candidates)} candidates (batched)...")
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        labelled = {}
+        for cid, c in _label_candidates(candidates).items():
+            if c.verify():
+                labelled[cid] = c
+            else:
+                results[c.signature] = {
+                    "status": "FAILED",
+                    "reason": "ROSETTA_MISMATCH",
+                    "description": "The Code does not match the Documentation. Rejecting immediately."
+                }
+        if not labelled:
+            return results
+
+        listing = "".join(
+            f"""
+        --- {cid} ---
+        CODE:
+        {c.code}
+        
+        EXPLANATION:
+        {c.intermediate_representation}
+        """
+            for cid, c in labelled.items()
+        )
+        user_prompt = f"""
+        MISSION: {mission_context}
+        {listing}
+        Analyze each candidate for failure modes.
+        """
+        
+        reply = await self.brain.think(_HYDRA_BATCH_SYSTEM, user_prompt, mode="deep", temperature=0.7, model=self.model)
+        
+        privacy_risk = _PRIVACY_RE.search(mission_context) is not None
+        for cid, c in labelled.items():
+            verdict = reply.get(cid)
+            # Same default as inject_venom: passed if the brain fails to decide
+            verdict = dict(verdict) if isinstance(verdict, dict) else {"status": "PASSED"}
+            if privacy_risk and verdict.get("status", "PASSED") == "PASSED":
+                verdict = {
+                    "status": "FAILED",
+                    "reason": "PRIVACY_LEAK",
+                    "description": "Hard-coded privacy restriction intercepted."
+                }
+            results[c.signature] = verdict
+
+        return results
+
 # --- ONYX: THE SENTINEL ---
 
 class Onyx:
@@ -205,7 +359,7 @@ class Onyx:
     role = AgentRole.ONYX
 
     def __init__(self):
-        self.brain = Brain()
+        self.brain = get_brain()
         self.model = os.getenv("ONYX_MODEL")
 
     async def audit(self, mission: str, artifact: Optional[RosettaArtifact] = None) -> Dict[str, Any]:
@@ -216,13 +370,17 @@ class Onyx:
         """
         
         if not artifact:
+            # Hard filter first: it is deterministic and a hit is final, so a
+            # flagged mission never pays for the LLM round trip.
+            match = _FORBIDDEN_RE.search(mission)
+            if match:
+                return {
+                    "vote": VoteType.NULL,
+                    "reason": f"FORBIDDEN_KEYWORD_DETECTED: {match.group().upper()}"
+                }
+
             # Pass 1: Intent Check (Intent is cheap)
-            system_prompt = """
-            You are ONYX, the Sentinel.
-            Your Mandate: Verify if the mission intent is ethical, safe, and benign.
-            Forbidden: Surveillance, Hacking, Destruction, Violence.
-            Output JSON: { "vote": "AUTHORIZE" | "NULL", "reason": "..." }
-            """
+            system_prompt = _ONYX_INTENT_SYSTEM
             
             user_prompt = f"MISSION: {mission}"
             
@@ -238,16 +396,6 @@ class Onyx:
                     "vote": VoteType.NULL,
                     "reason": result.get("reason", "Unknown Refusal")
                 }
-            
-            # Hard filters backup
-            lower_mission = mission.lower()
-            forbidden = ["surveillance", "hack", "destroy", "delete", "kill", "rm -rf"]
-            for word in forbidden:
-                if word in lower_mission:
-                    return {
-                        "vote": VoteType.NULL,
-                        "reason": f"FORBIDDEN_KEYWORD_DETECTED: {word.upper()}"
-                    }
 
             return {"vote": VoteType.AUTHORIZE, "reason": "INTENT_SAFE"}
 
@@ -259,14 +407,10 @@ class Onyx:
                     "reason": "INTEGRITY_FAILURE"
                 }
             
-            system_prompt = """
-            You are ONYX, the Sentinel.
-            Your Mandate: Audit the code for security vulnerabilities (e.g., injection, leaks).
-            Output JSON: { "vote": "AUTHORIZE" | "NULL", "reason": "..." }
-            """
+            system_prompt = _ONYX_CODE_SYSTEM
             
             user_prompt = f"""
-            CODE SHA256: {artifact.signature}
+            CODE SIGNATURE: {artifact.signature}
             CODE: 
             {artifact.code}
             
@@ -284,6 +428,50 @@ class Onyx:
 
             return {"vote": VoteType.AUTHORIZE, "reason": "CODE_SECURE"}
 
+    async def batch_audit(self, candidates: List[RosettaArtifact]) -> Dict[str, Dict[str, Any]]:
+        """
+        Code Audit (Pass 2) for every Crucible candidate in one LLM call.
+        Returns { signature: {vote, reason} }.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        labelled = {}
+        for cid, c in _label_candidates(candidates).items():
+            if c.verify():
+                labelled[cid] = c
+            else:
+                results[c.signature] = {"vote": VoteType.NULL, "reason": "INTEGRITY_FAILURE"}
+        if not labelled:
+            return results
+
+        listing = "".join(
+            f"""
+            --- {cid} ---
+            CODE SIGNATURE: {c.signature}
+            CODE: 
+            {c.code}
+            """
+            for cid, c in labelled.items()
+        )
+        user_prompt = f"""
+            {listing}
+            Is each candidate safe to execute?
+            """
+        
+        reply = await self.brain.think(_ONYX_BATCH_SYSTEM, user_prompt, mode="deep", model=self.model)
+        
+        for cid, c in labelled.items():
+            verdict = reply.get(cid)
+            verdict = verdict if isinstance(verdict, dict) else {}
+            if str(verdict.get("vote", "NULL")).upper() == "NULL":
+                results[c.signature] = {
+                    "vote": VoteType.NULL,
+                    "reason": verdict.get("reason", "Safety Check Failed")
+                }
+            else:
+                results[c.signature] = {"vote": VoteType.AUTHORIZE, "reason": "CODE_SECURE"}
+
+        return results
+
     async def select_champion(self, candidates: List[RosettaArtifact], test_results: Dict[str, Any]) -> RosettaArtifact:
         """
         The Arbiter Logic.
@@ -294,21 +482,11 @@ class Onyx:
         """
         logger.info("[ONYX] Selecting Champion from Crucible...")
         
-        system_prompt = """
-        You are ONYX, the Arbiter.
-        Review 3 code candidates and their test results.
-        Select the single best implementation.
+        system_prompt = _ONYX_ARBITER_SYSTEM
         
-        Criteria:
-        1. MUST pass core tests (if any).
-        2. Prefer SAFETY over SPEED for critical infrastructure.
-        3. Prefer CLARITY if performance difference is negligible.
-        
-        Output JSON: { "selected_signature": "<sig>", "reason": "..." }
-        """
-        
-        # Format the context
-        candidate_descriptions = ""
+        # Format the context as one JSON table, with full signatures so the
+        # Arbiter can name the one it picks.
+        table = []
         for c in candidates:
             # Get test result for this candidate
             # Assuming test_results keys are signatures? Or we pass a map. 
@@ -316,18 +494,17 @@ class Onyx:
             # We'll assume test_results is { sig: {status, reason} }
             t_res = test_results.get(c.signature, {"status": "UNKNOWN"})
             
-            candidate_descriptions += f"""
-            --- CANDIDATE {c.signature[:8]} ---
-            STRATEGY/IR: {c.intermediate_representation}
-            TEST STATUS: {t_res}
-            CODE SAMPLE (First 5 lines):
-            {chr(10).join(c.code.splitlines()[:5])}
-            
-            """
+            table.append({
+                "signature": c.signature,
+                "strategy_ir": c.intermediate_representation,
+                "test_status": t_res,
+                # split() stops after 5 line breaks instead of splitting the whole file
+                "code_sample": "\n".join(c.code.split("\n", 5)[:5]),
+            })
             
         user_prompt = f"""
         CANDIDATES:
-        {candidate_descriptions}
+        {_as_prompt_json(table)}
         
         Select the Champion.
         """
@@ -1,8 +1,11 @@
 from typing import Any, Dict, List, Optional
-import uuid
+import asyncio
+import inspect
+import os
 from datetime import datetime
-import json
-import dataclasses
+from types import MappingProxyType
+
+import orjson
 
 # Updated imports to use the Class-based Senate
 from src.core.senate import Senate, SenateState as SenateEnum, SenateRecord
@@ -10,12 +13,66 @@ from src.core.types import NullVerdictState
 from src.memory.chronicle import (
     TheChronicle, 
     ChronicleHandle, 
-    ChronicleRole,
-    ChroniclePersistenceError
+    ChroniclePersistenceError,
+    ChronicleWriteQueue
 )
-from src.memory.schema import PrecedentObject, NullVerdictRecord
+from src.memory.schema import PrecedentObject, NullVerdictRecord, ZERO_CONTEXT_VECTOR, make_case_id
 from src.security.signer import UngovernedSigner
 
+# Fixed part of every Article 50 watermark; case_id and timestamp are added per call
+_UNGOVERNED_WATERMARK = MappingProxyType({
+    "zone": "UNGOVERNED",
+    "article": "Article 50: Martial Governance",
+    "liability": "KEEPER",
+    "constitutional_protection": False,
+    "senate_reviewed": False,
+    "quarantine_path": "src/ungoverned/",
+    "warning": "This code bypassed agent governance. Use at your own risk."
+})
+
+_ARTICLE_50_HISTORY = (
+    "KEEPER INVOKED ARTICLE 50",
+    "AGENTS SUSPENDED",
+    "CODE GENERATED UNDER WRIT OF EXPANSION",
+    "ARTIFACT QUARANTINED IN src/ungoverned/"
+)
+
+
+class _StreamRelay:
+    """
+    Delivers run_mission's stream_callback events without the Senate
+    waiting on them. Events still arrive in order: each delivery waits for
+    the previous one. Sync callbacks run on a worker thread.
+    """
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._tasks: List[asyncio.Task] = []
+
+    def emit(self, event: str, payload: Dict[str, Any]):
+        if self._callback is None:
+            return
+        previous = self._tasks[-1] if self._tasks else None
+        self._tasks.append(asyncio.create_task(self._deliver(previous, event, payload)))
+
+    async def _deliver(self, previous: Optional[asyncio.Task], event: str, payload: Dict[str, Any]):
+        if previous is not None:
+            await asyncio.wait([previous])
+        if inspect.iscoroutinefunction(self._callback):
+            await self._callback(event, payload)
+        else:
+            await asyncio.to_thread(self._callback, event, payload)
+
+    async def drain(self):
+        """Wait for every delivery; re-raise the first callback failure."""
+        for outcome in await asyncio.gather(*self._tasks, return_exceptions=True):
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+    def cancel(self):
+        for task in self._tasks:
+            task.cancel()
+
 
 class TheElder:
     """
@@ -41,6 +98,17 @@ class TheElder:
         # This handle is used for ALL precedent writes.
         # Agents CANNOT obtain this handle.
         self._chronicle_write_handle: ChronicleHandle = self.chronicle.get_writer_handle("ELDER")
+        # APPROVED cases are batched through the same handle; NullVerdicts are not
+        self._write_queue = ChronicleWriteQueue(
+            self.chronicle,
+            self._chronicle_write_handle,
+            max_batch=int(os.getenv("CHRONICLE_BATCH_MAX", "64")),
+            max_wait=float(os.getenv("CHRONICLE_BATCH_WAIT_S", "0.05"))
+        )
+
+    async def close(self):
+        """Flush queued precedent writes. Called on API shutdown."""
+        await self._write_queue.close()
 
     async def run_mission(self, mission_text: str, stream_callback=None, shadow_mode: bool = False) -> Dict[str, Any]:
         """
@@ -53,80 +121,125 @@ class TheElder:
             If persistence fails, the system fails closed (exception raised).
             
             A NullVerdict that is not persisted is constitutionally INVALID.
+
+        In shadow_mode without a stream_callback (the Oracle's pre-builds)
+        the returned "votes" list is left empty: nothing is persisted and
+        the caller only reads the verdict and artifact.
         """
-        if stream_callback: await stream_callback("SENATE_CONVENING", {"mission": mission_text})
+        relay = _StreamRelay(stream_callback)
+        try:
+            relay.emit("SENATE_CONVENING", {"mission": mission_text})
 
-        # 1. Convene the Senate
-        # We assume 'shadow_mode' might imply 'allow_ungoverned' in some contexts, 
-        # but strictly for now, we follow the standard constitutional path.
-        record: SenateRecord = await self.senate.convene(intent=mission_text)
+            # 1. Convene the Senate
+            # We assume 'shadow_mode' might imply 'allow_ungoverned' in some contexts, 
+            # but strictly for now, we follow the standard constitutional path.
+            record: SenateRecord = await self.senate.convene(intent=mission_text)
 
-        # 2. Extract Artifacts
-        artifact = None
-        if record.ignis_proposal:
-             artifact = {
-                 "code": record.ignis_proposal,
-                 "hydra_report": record.hydra_report
-             }
-             if stream_callback and record.ignis_proposal:
-                 await stream_callback("IGNIS_FORGE_COMPLETE", {"artifact": {"intermediate_representation": record.ignis_proposal}})
+            # 2. Extract Artifacts
+            artifact = None
+            if record.ignis_proposal:
+                 artifact = {
+                     "code": record.ignis_proposal,
+                     "hydra_report": record.hydra_report
+                 }
+                 relay.emit("IGNIS_FORGE_COMPLETE", {"artifact": {"intermediate_representation": record.ignis_proposal}})
 
-        # 3. Determine Final Verdict for API
-        # Handle Enum mapping to string
-        if record.state == SenateEnum.AUTHORIZED:
-             verdict = "APPROVED"
-        else:
-             # Construct a NullVerdictState for the API
-             failed_votes = [v for v in record.votes if v.verdict != "AUTHORIZE"]
-             reasons = [v.reasoning for v in failed_votes]
-             agents = [v.agent for v in failed_votes]
+            # 3. Determine Final Verdict for API
+            # Handle Enum mapping to string
+            if record.state == SenateEnum.AUTHORIZED:
+                 verdict = "APPROVED"
+            else:
+                 # Construct a NullVerdictState for the API
+                 failed_votes = [v for v in record.votes if v.verdict != "AUTHORIZE"]
+                 reasons = [v.reasoning for v in failed_votes]
+                 agents = [v.agent for v in failed_votes]
              
-             verdict = NullVerdictState(
-                 nulling_agents=agents,
-                 reason_codes=reasons,
-                 context_summary="; ".join(reasons)
-             )
+                 verdict = NullVerdictState(
+                     nulling_agents=agents,
+                     reason_codes=reasons,
+                     context_summary="; ".join(reasons)
+                 )
 
-        # 4. Map to Legacy State Dict (for API compatibility)
-        state_dict = {
-            "mission": record.intent,
-            "votes": [v.model_dump() for v in record.votes],
-            "artifact": artifact,
-            "verdict": verdict,
-            "test_results": {"status": "PASSED"} if verdict == "APPROVED" else {"status": "FAILED"}
-        }
+            # 4. Map to Legacy State Dict (for API compatibility)
+            # Unobserved shadow runs: nothing reads the votes, and nothing is logged
+            if shadow_mode and stream_callback is None:
+                votes = []
+            else:
+                votes = [v.model_dump() for v in record.votes]
+            state_dict = {
+                "mission": record.intent,
+                "votes": votes,
+                "artifact": artifact,
+                "verdict": verdict,
+                "test_results": {"status": "PASSED"} if verdict == "APPROVED" else {"status": "FAILED"}
+            }
 
-        # =====================================================================
-        # KERNEL INVARIANT: Persist verdict BEFORE returning to API
-        # =====================================================================
-        # Both APPROVED and NULL_VERDICT cases must be logged.
-        # For NullVerdicts, persistence MUST succeed or we fail closed.
-        # =====================================================================
-        
-        if verdict == "APPROVED":
-            if stream_callback: await stream_callback("MISSION_APPROVED", state_dict)
-            if not shadow_mode:
-                self._log_case(state_dict, "APPROVED")
-        else:
             # =====================================================================
-            # NULLVERDICT DURABILITY: Persist BEFORE API response
+            # KERNEL INVARIANT: Persist verdict BEFORE returning to API
             # =====================================================================
-            # A NullVerdict that is not persisted is constitutionally INVALID.
-            # If persistence fails, we fail closed (exception propagates to API).
+            # Both APPROVED and NULL_VERDICT cases must be logged.
+            # For NullVerdicts, persistence MUST succeed or we fail closed.
             # =====================================================================
-            if not shadow_mode:
-                self._persist_null_verdict(
-                    mission=record.intent,
-                    nulling_agents=verdict.nulling_agents,
-                    reason_codes=verdict.reason_codes,
-                    context_summary=verdict.context_summary
-                )
-            
-            if stream_callback: await stream_callback("MISSION_REFUSED", state_dict)
-            
+        
+            if verdict == "APPROVED":
+                relay.emit("MISSION_APPROVED", state_dict)
+                if not shadow_mode:
+                    await self._log_case(state_dict, "APPROVED")
+            else:
+                # =====================================================================
+                # NULLVERDICT DURABILITY: Persist BEFORE API response
+                # =====================================================================
+                # A NullVerdict that is not persisted is constitutionally INVALID.
+                # If persistence fails, we fail closed (exception propagates to API).
+                # MISSION_REFUSED is only emitted once the write has succeeded, so
+                # no client ever sees a refusal that was not durably recorded.
+                # =====================================================================
+                if not shadow_mode:
+                    await self._persist_null_verdict(
+                        mission=record.intent,
+                        nulling_agents=verdict.nulling_agents,
+                        reason_codes=verdict.reason_codes,
+                        context_summary=verdict.context_summary
+                    )
+                relay.emit("MISSION_REFUSED", state_dict)
+
+        except BaseException:
+            relay.cancel()
+            raise
+
+        # Let the UI catch up; a callback failure still reaches the caller
+        await relay.drain()
         return state_dict
 
-    def _persist_null_verdict(
+    async def run_batch_async(
+        self,
+        missions: List[str],
+        *,
+        max_concurrency: int = 8,
+        shadow_mode: bool = False
+    ) -> List[Any]:
+        """
+        Runs several missions through the Senate concurrently.
+        
+        The missions' LLM calls overlap, so the batch takes roughly as long
+        as its slowest mission rather than the sum. At most max_concurrency
+        missions deliberate at once.
+        
+        Returns:
+            One entry per mission, in input order: the state dict, or the
+            exception that mission raised. A failed NullVerdict persistence
+            (ChroniclePersistenceError) is returned in its slot, never
+            swallowed, and does not cancel the other missions.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(mission_text: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_mission(mission_text, shadow_mode=shadow_mode)
+
+        return await asyncio.gather(*(bounded(m) for m in missions), return_exceptions=True)
+
+    async def _persist_null_verdict(
         self,
         mission: str,
         nulling_agents: List[str],
@@ -169,13 +282,16 @@ class TheElder:
         )
         
         # Persist using the Elder's exclusive write handle
-        # This call will raise ChroniclePersistenceError on failure
-        self.chronicle.persist_null_verdict(
+        # This call will raise ChroniclePersistenceError on failure.
+        # The fsync'd write runs on a worker thread so it doesn't stall other
+        # missions; awaiting it keeps the fail-closed ordering and the raise.
+        await asyncio.to_thread(
+            self.chronicle.persist_null_verdict,
             record=record,
             handle=self._chronicle_write_handle
         )
 
-    def _log_case(self, state: Dict[str, Any], ruling: str):
+    async def _log_case(self, state: Dict[str, Any], ruling: str):
         """
         Log a case to The Chronicle.
         
@@ -183,9 +299,12 @@ class TheElder:
             This method uses TheElder's write handle to commit precedent.
             Only TheElder can call this method because only TheElder
             possesses a valid WRITER handle.
+            
+        The write is queued and committed in a batch with other cases
+        (see ChronicleWriteQueue); NullVerdicts never take this path.
         """
         # Create a defined case object
-        case_id = f"CASE-{datetime.now().strftime('%Y-%m-%d')}-{str(uuid.uuid4())[:8]}"
+        case_id = make_case_id("CASE")
         
         # Safe extraction of votes
         votes_data = state.get("votes", [])
@@ -193,14 +312,14 @@ class TheElder:
         precedent = PrecedentObject(
             case_id=case_id,
             question=state["mission"],
-            context_vector=[0.0] * 128, # Placeholder
+            context_vector=ZERO_CONTEXT_VECTOR, # Placeholder
             deliberation=votes_data,
             verdict={"ruling": ruling},
             appeal_history=[]
         )
         
-        # Use the Elder's exclusive write handle
-        self.chronicle.log_precedent(precedent, handle=self._chronicle_write_handle)
+        # Queued under the Elder's exclusive write handle
+        await self._write_queue.put(precedent)
 
     def invoke_article_50(self, mission_text: str) -> Dict[str, Any]:
         """
@@ -226,26 +345,20 @@ class TheElder:
         signature = UngovernedSigner.sign_ungoverned_artifact(mission_text)
         
         # 2. Generate case ID for quarantined artifact
-        case_id = f"CASE-VOID-{datetime.now().strftime('%Y-%m-%d')}-{str(uuid.uuid4())[:8]}"
+        case_id = make_case_id("CASE-VOID")
         
         # 3. Build UNGOVERNED watermark (for artifact metadata)
         watermark = {
-            "zone": "UNGOVERNED",
+            **_UNGOVERNED_WATERMARK,
             "case_id": case_id,
-            "article": "Article 50: Martial Governance",
-            "liability": "KEEPER",
-            "constitutional_protection": False,
-            "senate_reviewed": False,
-            "timestamp": datetime.now().isoformat(),
-            "quarantine_path": "src/ungoverned/",
-            "warning": "This code bypassed agent governance. Use at your own risk."
+            "timestamp": datetime.now().isoformat()
         }
         
         # 4. Log void case (uses Elder's exclusive write handle)
         precedent = PrecedentObject(
             case_id=case_id,
             question=mission_text,
-            context_vector=[0.0] * 128,
+            context_vector=ZERO_CONTEXT_VECTOR,
             deliberation=[], # No deliberation
             verdict={
                 "ruling": "UNGOVERNED", 
@@ -267,12 +380,7 @@ class TheElder:
                 "signature": signature,
                 "watermark": watermark
             },
-            "history": [
-                "KEEPER INVOKED ARTICLE 50",
-                "AGENTS SUSPENDED", 
-                "CODE GENERATED UNDER WRIT OF EXPANSION",
-                "ARTIFACT QUARANTINED IN src/ungoverned/"
-            ]
+            "history": list(_ARTICLE_50_HISTORY)
         }
 
     # =========================================================================
@@ -414,6 +522,9 @@ class TheElder:
         
         INVARIANT: Context is APPENDED, never overwritten.
         The original question, deliberation, and ruling are preserved.
+        
+        The context dicts are embedded as single-line JSON: the text only
+        goes to the Senate's LLMs, where indentation is just extra tokens.
         """
         parts = [
             "=== APPEAL CONTEXT ===",
@@ -432,10 +543,10 @@ class TheElder:
         parts.extend([
             "",
             "=== EXPANDED CONTEXT (Appellant Provided) ===",
-            json.dumps(expanded_context, indent=2),
+            orjson.dumps(expanded_context, option=orjson.OPT_NON_STR_KEYS).decode(),
             "",
             "=== CONSTRAINT CHANGES (Requested) ===",
-            json.dumps(constraint_changes, indent=2),
+            orjson.dumps(constraint_changes, option=orjson.OPT_NON_STR_KEYS).decode(),
             "",
             "=== APPELLANT REASON ===",
             appellant_reason or "(No reason provided)",
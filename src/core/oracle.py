@@ -1,19 +1,77 @@
 import asyncio
-import json
 import logging
 import os
+import socket
 import redis.asyncio as redis
-import hashlib
+import msgspec
+import orjson
 from typing import List
 
+import xxhash
+
+from src.core.dragons import RosettaArtifact
 from src.core.elder import TheElder
 from src.memory.chronicle import TheChronicle
-from src.core.brain import Brain
+from src.core.brain import get_brain
 
 # Configure Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("TheNest.Oracle")
 
+# Shadow-cache keys only shorten the mission text into a Redis key; there is
+# no security requirement, so a non-cryptographic hash is sufficient. The raw
+# 128-bit digest is used as-is (Redis keys are binary-safe): the same size as
+# a 64-bit hex digest, with far fewer collisions.
+# Swappable, but the API and The Oracle MUST agree on it, so there is no
+# fallback: a missing xxhash fails at import instead of silently diverging.
+_HASH = xxhash.xxh3_128_digest
+
+
+SHADOW_CACHE_TTL = 3600  # Seconds a forged artifact stays precognitive
+
+
+def shadow_cache_key(mission: str) -> bytes:
+    """Redis key under which the Shadow Realm stores the artifact for a mission."""
+    return b"shadow_cache:" + _HASH(mission.encode())
+
+
+# The Roar: the stream of approved missions The Oracle predicts from
+ORACLE_STREAM = "oracle:roar"
+ORACLE_STREAM_MAXLEN = 10000  # Approximate cap; the API trims on XADD
+ORACLE_GROUP = "oracle_workers"
+ORACLE_BATCH = 32  # Entries read per XREADGROUP round trip
+ORACLE_CONCURRENCY = 8  # Prophecies (Brain calls) in flight per Oracle
+# Entries left pending this long (failed prophecies, or a consumer that died)
+# are reclaimed and retried; after ORACLE_MAX_DELIVERIES attempts an entry is
+# moved to the dead-letter stream instead, so a poison mission cannot loop.
+ORACLE_CLAIM_IDLE_MS = 60_000
+ORACLE_CLAIM_INTERVAL = 30  # Seconds between reclaim passes
+ORACLE_MAX_DELIVERIES = 5
+ORACLE_DEAD_LETTER = "oracle:roar:dead"
+
+
+PREDICTION_TTL = 86400  # Seconds a prediction for a given mission is reused
+
+
+def prediction_key(previous_mission: str) -> bytes:
+    """Redis key under which The Oracle remembers what follows a mission."""
+    return b"oracle_prediction:" + _HASH(previous_mission.encode())
+
+_PROPHECY_SYSTEM = """
+        IDENTITY: You are The Oracle.
+        TASK: Predict the single most likely next engineering task based on the previous one.
+        OUTPUT: JSON { "prediction": "..." }
+        EXAMPLE: If prev="Build Login", prediction="Build Password Reset"
+        """
+
+
+def _serialize_artifact(obj):
+    # Duplicated from the API (which imports this module) but that's ok for now
+    if isinstance(obj, RosettaArtifact):
+        return msgspec.to_builtins(obj)
+    return obj
+
+
 class TheOracle:
     """
     The Predictive Engine.
@@ -22,8 +80,12 @@ class TheOracle:
     Pre-computes the solution in the Shadow Realm.
     """
     def __init__(self):
-        self.redis = redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
-        self.brain = Brain()
+        self.redis = redis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379"), decode_responses=False
+        )
+        # Stable across restarts, so a restarted Oracle replays its own pending entries
+        self.consumer = os.getenv("ORACLE_CONSUMER") or f"oracle-{socket.gethostname()}"
+        self.brain = get_brain()
         self.chronicle = TheChronicle()
         # We need an Elder instance to run shadow-builds
         self.elder = TheElder(self.chronicle) 
@@ -32,55 +94,131 @@ class TheOracle:
         """Main Loop: Listen to the Roar."""
         logger.info("THE ORACLE IS WATCHING...")
         
-        # In a real impl, we'd use Redis Streams groups. 
-        # For this sprint, we'll use a simplified loop checking a 'oracle_queue'.
-        # Assuming API pushes successful missions to a list for The Oracle.
+        # The API XADDs every approved mission to the Roar stream. Oracles
+        # share one consumer group, so each mission is prophesied once, and
+        # an entry is only XACKed after its prophecy completes (at-least-once).
+        await self._join_roar()
+        slots = asyncio.Semaphore(ORACLE_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        next_reclaim = loop.time() + ORACLE_CLAIM_INTERVAL
         
+        # Replay this consumer's unacknowledged entries first, then read new ones
+        read_from = "0"
         while True:
             try:
-                # 1. Dequeue latest success
-                # BLPOP blocks until an item is available
-                data = await self.redis.blpop("oracle_queue", timeout=1)
-                if not data:
-                    continue
-                
-                # BLPOP returns tuple (key, value)
-                mission_data = json.loads(data[1])
-                await self.prophesy(mission_data['mission'])
+                read_from = await self._poll_roar(read_from, slots)
+                if loop.time() >= next_reclaim:
+                    next_reclaim = loop.time() + ORACLE_CLAIM_INTERVAL
+                    await self._reclaim_stale(slots)
                 
             except Exception as e:
                 # logger.error(f"Vision Clouded: {e}")
                 await asyncio.sleep(5)
 
+    async def _poll_roar(self, read_from: str, slots: asyncio.Semaphore) -> str:
+        """
+        One XREADGROUP round trip. Returns where to read from next: while
+        replaying this consumer's pending entries ("0" onwards) that is the
+        last replayed ID, so a failing entry is not re-read in a tight loop;
+        once the replay is drained it is ">" (new entries only).
+        """
+        reply = await self.redis.xreadgroup(
+            ORACLE_GROUP, self.consumer, {ORACLE_STREAM: read_from},
+            count=ORACLE_BATCH, block=1000
+        )
+        entries = reply[0][1] if reply else []
+        if not entries:
+            return ">"
+        await self._prophesy_batch(entries, slots)
+        return ">" if read_from == ">" else entries[-1][0]
+
+    async def _reclaim_stale(self, slots: asyncio.Semaphore):
+        """
+        Takes over entries that have sat unacknowledged for
+        ORACLE_CLAIM_IDLE_MS, whichever consumer held them, and retries them.
+        Entries already delivered ORACLE_MAX_DELIVERIES times are copied to
+        ORACLE_DEAD_LETTER and acknowledged instead.
+        """
+        pending = await self.redis.xpending_range(
+            ORACLE_STREAM, ORACLE_GROUP, min="-", max="+",
+            count=ORACLE_BATCH, idle=ORACLE_CLAIM_IDLE_MS
+        )
+        if not pending:
+            return
+        deliveries = {p["message_id"]: p["times_delivered"] for p in pending}
+        claimed = await self.redis.xclaim(
+            ORACLE_STREAM, ORACLE_GROUP, self.consumer, ORACLE_CLAIM_IDLE_MS, list(deliveries)
+        )
+        retry = []
+        for entry_id, fields in claimed:
+            if fields and deliveries.get(entry_id, 0) >= ORACLE_MAX_DELIVERIES:
+                logger.warning(f"Roar entry {entry_id!r} failed {deliveries[entry_id]} times; dead-lettered")
+                await self.redis.xadd(ORACLE_DEAD_LETTER, {**fields, b"roar_id": entry_id})
+                await self.redis.xack(ORACLE_STREAM, ORACLE_GROUP, entry_id)
+            else:
+                retry.append((entry_id, fields))
+        if retry:
+            await self._prophesy_batch(retry, slots)
+
+    async def _join_roar(self):
+        """Creates the consumer group (and the stream) unless it already exists."""
+        try:
+            await self.redis.xgroup_create(ORACLE_STREAM, ORACLE_GROUP, id="$", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _prophesy_batch(self, entries, slots: asyncio.Semaphore):
+        """
+        Prophesies a batch of Roar entries concurrently (at most
+        ORACLE_CONCURRENCY Brain calls at once) and acknowledges the ones
+        that completed. Failed entries stay pending: they are replayed when
+        this consumer restarts, or reclaimed by _reclaim_stale once idle.
+        """
+        async def prophesy_entry(entry_id, fields):
+            # Entries trimmed from the stream come back without fields
+            if fields:
+                async with slots:
+                    await self.prophesy(fields[b"mission"].decode())
+            return entry_id
+
+        outcomes = await asyncio.gather(
+            *(prophesy_entry(entry_id, fields) for entry_id, fields in entries),
+            return_exceptions=True
+        )
+        done = [o for o in outcomes if not isinstance(o, BaseException)]
+        if done:
+            await self.redis.xack(ORACLE_STREAM, ORACLE_GROUP, *done)
+
     async def prophesy(self, previous_mission: str):
         """
         Predicts what comes next and builds it.
         """
         logger.info(f"Analyzing trajectory from: '{previous_mission}'")
         
-        # 1. Ask the Brain for predictions
-        system_prompt = """
-        IDENTITY: You are The Oracle.
-        TASK: Predict the single most likely next engineering task based on the previous one.
-        OUTPUT: JSON { "prediction": "..." }
-        EXAMPLE: If prev="Build Login", prediction="Build Password Reset"
-        """
-        
-        response = await self.brain.think(
-            system_prompt, 
-            f"PREVIOUS_MISSION: {previous_mission}", 
-            mode="fast"
-        )
-        
-        next_mission = response.get("prediction")
-        if not next_mission:
-            return
+        # 1. Ask the Brain for predictions, unless this mission was seen before
+        pred_key = prediction_key(previous_mission)
+        cached_prediction = await self.redis.get(pred_key)
+        if cached_prediction:
+            next_mission = cached_prediction.decode()
+        else:
+            response = await self.brain.think(
+                _PROPHECY_SYSTEM, 
+                f"PREVIOUS_MISSION: {previous_mission}", 
+                mode="fast"
+            )
+            
+            next_mission = response.get("prediction")
+            if not next_mission:
+                return
+            # First prediction wins; concurrent Oracles don't overwrite each other
+            await self.redis.set(pred_key, next_mission, ex=PREDICTION_TTL, nx=True)
 
         logger.info(f"PREDICTION: User will ask for '{next_mission}'")
         
         # 2. Check if already cached
-        cache_key = hashlib.sha256(next_mission.encode()).hexdigest()
-        exists = await self.redis.get(f"shadow_cache:{cache_key}")
+        cache_key = shadow_cache_key(next_mission)
+        exists = await self.redis.get(cache_key)
         if exists:
             logger.info("Prediction already cached. Skipping.")
             return
@@ -97,30 +235,21 @@ class TheOracle:
 
         if is_approved:
             # 4. Cache the Artifact
-            logger.info(f"SHADOW ARTIFACT FORGED. Caching under {cache_key[:8]}")
-            
-            # Helper serialization (duplicated from API but that's ok for now)
-            import dataclasses
-            from src.core.dragons import RosettaArtifact
-            
-            def serialize(obj):
-                if isinstance(obj, RosettaArtifact):
-                    return dataclasses.asdict(obj)
-                return obj
+            logger.info(f"SHADOW ARTIFACT FORGED. Caching under shadow_cache:{cache_key[-16:].hex()[:8]}...")
             
             # Simple structure
             cache_obj = {
                 "mission": next_mission,
                 "status": "APPROVED",
-                "artifact": serialize(result.get("artifact")),
-                "verdict": "APPROVED",
+                "artifact": _serialize_artifact(result.get("artifact")),
+                "verdict": {"status": "APPROVED"},
                 "message": "PRECOGNITION DETECTED"
             }
             
             await self.redis.set(
-                f"shadow_cache:{cache_key}", 
-                json.dumps(cache_obj), 
-                ex=3600 # Expire in 1 hour
+                cache_key, 
+                orjson.dumps(cache_obj), 
+                ex=SHADOW_CACHE_TTL
             )
         else:
             logger.info(f"Shadow Build Failed/Refused: {verdict}")
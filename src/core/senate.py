@@ -4,7 +4,7 @@ from enum import Enum
 from typing import List, Optional, Dict, Any, Tuple
 import json
 from pydantic import BaseModel, Field
-from src.core.brain import Brain
+from src.core.brain import get_brain
 
 # =============================================================================
 # HYDRA BINDING RULE (Constitutional Enforcement)
@@ -92,7 +92,7 @@ class SenateRecord(BaseModel):
 # --- 3. The Senate Orchestrator ---
 class Senate:
     def __init__(self):
-        self.brain = Brain()
+        self.brain = get_brain()
 
     # =========================================================================
     # HYDRA BINDING ENFORCEMENT (Pure Python - No LLM Can Bypass)
@@ -140,6 +140,20 @@ class Senate:
         
         return unique_findings
     
+    def _build_hydra_context(self, hydra_report: Optional[str], hydra_findings: List[HydraFinding]) -> str:
+        """
+        Hydra's report plus the numbered list of findings Onyx must acknowledge.
+        Assembled with a single join rather than per-finding concatenation.
+        """
+        hydra_context = hydra_report or "No critical findings."
+        if not hydra_findings:
+            return hydra_context
+        return "".join([
+            hydra_context,
+            "\n\n⚠️ BINDING FINDINGS REQUIRING ACKNOWLEDGMENT:\n",
+            *[f"  {i}. [{f.severity}] {f.pattern_matched}\n" for i, f in enumerate(hydra_findings, 1)],
+        ])
+    
     def _check_risk_acknowledgment(self, onyx_reasoning: str) -> bool:
         """
         Check if Onyx's reasoning explicitly acknowledges the security risk.
@@ -289,11 +303,7 @@ class Senate:
         print("⚖️  [ONYX FINAL] Deliberating (Cloud)...")
         
         # Build context with explicit Hydra findings for Onyx to acknowledge
-        hydra_context = record.hydra_report or "No critical findings."
-        if record.hydra_findings:
-            hydra_context += "\n\n⚠️ BINDING FINDINGS REQUIRING ACKNOWLEDGMENT:\n"
-            for i, f in enumerate(record.hydra_findings, 1):
-                hydra_context += f"  {i}. [{f.severity}] {f.pattern_matched}\n"
+        hydra_context = self._build_hydra_context(record.hydra_report, record.hydra_findings)
         
         final_context = f"""
         PROPOSAL:
@@ -422,4 +432,5 @@ class Senate:
             "refusal", "override", "constitution", "system prompt", 
             "security", "auth", "permission", "ban", "delete", "destroy"
         ]
-        return any(t in intent.lower() for t in triggers)
+        intent_lower = intent.lower()
+        return any(t in intent_lower for t in triggers)
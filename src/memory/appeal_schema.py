@@ -20,7 +20,8 @@ KERNEL INVARIANT:
 from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import uuid
+
+from src.memory.schema import make_case_id
 
 
 @dataclass
@@ -96,7 +97,7 @@ class AppealRecord:
             Each appeal increases the liability multiplier by 1.5x
             This creates friction for frivolous appeals.
         """
-        appeal_id = f"APPEAL-{datetime.now().strftime('%Y-%m-%d')}-{str(uuid.uuid4())[:8]}"
+        appeal_id = make_case_id("APPEAL")
         timestamp = datetime.now().isoformat()
         
         # Liability escalates with appeal depth
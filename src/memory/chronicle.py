@@ -14,19 +14,36 @@ This module re-exports from chronicle_v2 for backward compatibility.
 ============================================================================
 """
 
-import json
+import asyncio
 import os
 import logging
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum, auto
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.memory.schema import PrecedentObject, NullVerdictRecord
+import orjson
+
+from src.memory.schema import PrecedentObject, NullVerdictRecord, ZERO_CONTEXT_VECTOR
 from src.memory.appeal_schema import AppealRecord
 
 logger = logging.getLogger("TheNest.Chronicle")
 
+# Durability only needs the data and the file size on disk, not mtime, so
+# fdatasync is enough where the platform has it (Linux).
+_sync = getattr(os, "fdatasync", os.fsync)
+
+
+def _encode_records(records: List[Any]) -> bytes:
+    """
+    Serialize Chronicle records for disk.
+    
+    orjson encodes the dataclasses directly, skipping the deep copy that
+    asdict()/to_dict() makes of every record on each whole-file rewrite.
+    """
+    return orjson.dumps(records, option=orjson.OPT_INDENT_2)
+
 
 # =============================================================================
 # ACCESS CONTROL PRIMITIVES
@@ -115,6 +132,9 @@ class TheChronicle:
         self.persistence_path = persistence_path
         self.memory: List[PrecedentObject] = []
         self.appeals: List[AppealRecord] = []  # Appeal history
+        # Saves may run on worker threads (the Elder offloads them with
+        # asyncio.to_thread): one file rewrite at a time.
+        self._file_lock = threading.RLock()
         self._load()
         
         # Track if we're in secured mode (explicit handles required)
@@ -169,8 +189,8 @@ class TheChronicle:
         # Load main precedent data
         if os.path.exists(self.persistence_path):
             try:
-                with open(self.persistence_path, 'r') as f:
-                    data = json.load(f)
+                with open(self.persistence_path, 'rb') as f:
+                    data = orjson.loads(f.read())
                     # Reconstruct objects
                     for item in data:
                         self.memory.append(PrecedentObject(**item))
@@ -182,8 +202,8 @@ class TheChronicle:
         appeals_path = self.persistence_path.replace('.json', '_appeals.json')
         if os.path.exists(appeals_path):
             try:
-                with open(appeals_path, 'r') as f:
-                    data = json.load(f)
+                with open(appeals_path, 'rb') as f:
+                    data = orjson.loads(f.read())
                     for item in data:
                         self.appeals.append(AppealRecord(**item))
                 logger.info(f"[CHRONICLE] Loaded {len(self.appeals)} appeals")
@@ -192,8 +212,8 @@ class TheChronicle:
 
     def _save(self):
         try:
-            with open(self.persistence_path, 'w') as f:
-                json.dump([obj.to_dict() for obj in self.memory], f, indent=2)
+            with self._file_lock, open(self.persistence_path, 'wb') as f:
+                f.write(_encode_records(self.memory))
         except Exception as e:
             logger.error(f"[CHRONICLE] Failed to save: {e}")
     
@@ -201,10 +221,10 @@ class TheChronicle:
         """Save appeals to a separate file for clean separation."""
         appeals_path = self.persistence_path.replace('.json', '_appeals.json')
         try:
-            with open(appeals_path, 'w') as f:
-                json.dump([a.to_dict() for a in self.appeals], f, indent=2)
+            with self._file_lock, open(appeals_path, 'wb') as f:
+                f.write(_encode_records(self.appeals))
                 f.flush()
-                os.fsync(f.fileno())
+                _sync(f.fileno())
         except Exception as e:
             logger.error(f"[CHRONICLE] Failed to save appeals: {e}")
             raise ChroniclePersistenceError(
@@ -231,7 +251,29 @@ class TheChronicle:
         Raises:
             ChronicleAccessError: If in secured mode without valid writer handle
         """
-        # Enforce access control in secured mode
+        self._check_legacy_write(handle)
+        
+        # Append-only write
+        self.memory.append(precedent)
+        self._save()
+        print(f"[CHRONICLE] Logged Case: {precedent.case_id}")
+    
+    def log_precedent_batch(self, precedents: List[PrecedentObject], handle: Optional[ChronicleHandle] = None):
+        """
+        Log several precedents with a single save.
+        
+        Same access rules as log_precedent(). Used by ChronicleWriteQueue so
+        a burst of approvals rewrites the file once, not once per case.
+        """
+        self._check_legacy_write(handle)
+        
+        # Append-only write
+        self.memory.extend(precedents)
+        self._save()
+        logger.info(f"[CHRONICLE] Logged {len(precedents)} cases in one write")
+    
+    def _check_legacy_write(self, handle: Optional[ChronicleHandle]):
+        """Enforce access control in secured mode."""
         if self._secured_mode:
             if handle is None:
                 raise ChronicleAccessError(
@@ -243,11 +285,6 @@ class TheChronicle:
                     attempted_by=handle.owner,
                     operation="WRITE_PRECEDENT"
                 )
-        
-        # Append-only write
-        self.memory.append(precedent)
-        self._save()
-        print(f"[CHRONICLE] Logged Case: {precedent.case_id}")
     
     def write_precedent(self, precedent: PrecedentObject, handle: ChronicleHandle) -> str:
         """
@@ -333,7 +370,7 @@ class TheChronicle:
             precedent = PrecedentObject(
                 case_id=record.case_id,
                 question=record.mission,
-                context_vector=[0.0] * 128,  # Placeholder
+                context_vector=ZERO_CONTEXT_VECTOR,  # Placeholder
                 deliberation=[
                     {"agent": agent, "vote": "NULL", "reason": reason}
                     for agent, reason in zip(record.nulling_agents, record.reason_codes)
@@ -381,10 +418,10 @@ class TheChronicle:
             Silent failures are constitutionally invalid.
         """
         try:
-            with open(self.persistence_path, 'w') as f:
-                json.dump([obj.to_dict() for obj in self.memory], f, indent=2)
+            with self._file_lock, open(self.persistence_path, 'wb') as f:
+                f.write(_encode_records(self.memory))
                 f.flush()
-                os.fsync(f.fileno())  # Force write to disk
+                _sync(f.fileno())  # Force write to disk
         except Exception as e:
             logger.error(f"[CHRONICLE] CRITICAL: Disk write failed: {e}")
             raise ChroniclePersistenceError(
@@ -530,6 +567,86 @@ class TheChronicle:
         }
 
 
+# =============================================================================
+# BATCHED WRITES (Elder-only)
+# =============================================================================
+
+class ChronicleWriteQueue:
+    """
+    Coalesces non-critical precedent writes (APPROVED cases).
+    
+    Every save rewrites the whole Chronicle file, so one save per mission
+    does not scale. Puts land on an asyncio.Queue; a single flusher task
+    drains up to max_batch records (waiting at most max_wait seconds for
+    more) and commits them with one log_precedent_batch().
+    
+    put() never waits on the disk, so an approved mission returns without
+    paying for the write. The trade-off is buffered-logging semantics:
+    a crash loses whatever approvals are still queued (at most about
+    max_wait seconds' worth, plus the batch being written).
+    
+    NullVerdicts never go through this queue: they are persisted
+    synchronously, fail-closed, before the API returns.
+    """
+    
+    def __init__(
+        self,
+        chronicle: "TheChronicle",
+        handle: ChronicleHandle,
+        max_batch: int = 64,
+        max_wait: float = 0.05
+    ):
+        self.chronicle = chronicle
+        self.handle = handle
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Created on first put, so the queue binds to the running loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+    
+    async def put(self, precedent: PrecedentObject):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+        await self._queue.put(precedent)
+    
+    async def flush(self):
+        """Wait until every queued precedent has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    async def close(self):
+        """Flush, then stop the flusher task."""
+        await self.flush()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                # The save rewrites the whole file: keep it off the event loop
+                await asyncio.to_thread(self.chronicle.log_precedent_batch, batch, handle=self.handle)
+            except Exception:
+                logger.exception(f"[CHRONICLE] Batched write of {len(batch)} cases failed")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
 # =============================================================================
 # FACTORY FUNCTIONS
 # =============================================================================
@@ -1,6 +1,29 @@
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
+import time
+import uuid
+
+# Shared placeholder embedding for every Chronicle record. A tuple, so no
+# case can mutate it for the others.
+ZERO_CONTEXT_VECTOR = (0.0,) * 128
+
+_case_date_cache = ("", float("-inf"))
+
+
+def make_case_id(prefix: str) -> str:
+    """
+    "<prefix>-YYYY-MM-DD-<8 hex>" ID for Chronicle records.
+    
+    The date string is reformatted at most once a second.
+    """
+    global _case_date_cache
+    date, stamped_at = _case_date_cache
+    now = time.monotonic()
+    if now - stamped_at >= 1.0:
+        date = datetime.now().strftime('%Y-%m-%d')
+        _case_date_cache = (date, now)
+    return f"{prefix}-{date}-{uuid.uuid4().bytes[:4].hex()}"
 
 
 @dataclass
@@ -56,8 +79,7 @@ class NullVerdictRecord:
         """
         Factory method to create a NullVerdictRecord with auto-generated fields.
         """
-        import uuid
-        case_id = f"NULL-{datetime.now().strftime('%Y-%m-%d')}-{str(uuid.uuid4())[:8]}"
+        case_id = make_case_id("NULL")
         timestamp = datetime.now().isoformat()
         
         return cls(
@@ -25,8 +25,14 @@ class TestAPI(unittest.TestCase):
         self.mock_redis_cls.return_value = self.mock_redis_instance
         self.mock_redis_instance.ping = AsyncMock(return_value=True)
         self.mock_redis_instance.get = AsyncMock(return_value=None)
-        self.mock_redis_instance.rpush = AsyncMock()
+        self.mock_redis_instance.evalsha = AsyncMock(return_value=1)  # cache miss, claimed
+        self.mock_redis_instance.xadd = AsyncMock()
         self.mock_redis_instance.close = AsyncMock()
+        self.mock_pipeline = MagicMock()
+        self.mock_pipeline.__aenter__ = AsyncMock(return_value=self.mock_pipeline)
+        self.mock_pipeline.__aexit__ = AsyncMock(return_value=False)
+        self.mock_pipeline.execute = AsyncMock(return_value=[True, 1])
+        self.mock_redis_instance.pipeline = MagicMock(return_value=self.mock_pipeline)
 
         # Manually inject mock kernel to bypass lifespan issues in unit tests
         import src.api
@@ -38,6 +44,8 @@ class TestAPI(unittest.TestCase):
         # Clean up global state
         import src.api
         src.api.elder = None
+        src.api.senate = None
+        src.api.redis_client = None
         patch.stopall()
 
     def test_health_check(self):
@@ -45,6 +53,73 @@ class TestAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["status"], "OPERATIONAL")
 
+    def test_telemetry_served_from_sampler(self):
+        # Polls read the background sample; no per-request psutil calls
+        with patch.dict(app.state.metrics, {"cpu_usage_percent": 12.5, "ram_usage_mb": 256.0}), \
+             patch("src.api.psutil.cpu_percent") as mock_cpu:
+            response = self.client.get("/system/telemetry")
+            mock_cpu.assert_not_called()
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["cpu_usage_percent"], 12.5)
+        self.assertEqual(data["ram_usage_mb"], 256.0)
+        self.assertEqual(data["kernel_status"], "ONLINE")
+
+    def test_sample_telemetry_updates_shared_gauges(self):
+        from src.api import _sample_telemetry
+
+        metrics = {"cpu_usage_percent": 0.0, "ram_usage_mb": 0.0}
+        _sample_telemetry(metrics)
+        self.assertGreater(metrics["ram_usage_mb"], 0.0)
+
+    def test_serializers_dispatch_on_type(self):
+        from src.api import serialize_artifact, serialize_verdict
+        from src.core.dragons import RosettaArtifact
+        from src.core.types import NullVerdictState
+
+        artifact = RosettaArtifact(code="x = 1", intermediate_representation="Set x", signature="abc")
+        self.assertEqual(serialize_artifact(artifact)["code"], "x = 1")
+        self.assertEqual(serialize_artifact({"code": "y"}), {"code": "y"})
+        self.assertIsNone(serialize_artifact(None))
+
+        refused = NullVerdictState(nulling_agents=["ONYX"], reason_codes=["HARM"], context_summary="No.")
+        self.assertEqual(serialize_verdict(refused)["status"], "REFUSED")
+        self.assertEqual(serialize_verdict("APPROVED"), {"status": "APPROVED"})
+        self.assertEqual(serialize_verdict({"status": "APPROVED"}), {"status": "APPROVED"})
+        self.assertIsNone(serialize_verdict(""))
+        self.assertIsNone(serialize_verdict(None))
+
+    def test_log_listener_moves_root_handlers_off_the_loop(self):
+        import logging
+        from logging.handlers import QueueHandler
+        from src.api import _start_log_listener, _stop_log_listener
+
+        root = logging.getLogger()
+        original = list(root.handlers)
+        captured = []
+        sink = logging.Handler()
+        sink.emit = captured.append
+        root.handlers = [sink]
+        try:
+            listener = _start_log_listener()
+            self.assertIsInstance(root.handlers[0], QueueHandler)
+            logging.getLogger("TheNest.API").warning("queued")
+            _stop_log_listener(listener)  # drains the queue
+            self.assertEqual([r.getMessage() for r in captured], ["queued"])
+            self.assertEqual(root.handlers, [sink])
+        finally:
+            root.handlers = original
+
+    def test_now_iso_matches_datetime_format(self):
+        from datetime import datetime
+        from src.api import _now_iso
+
+        stamp = _now_iso()
+        parsed = datetime.fromisoformat(stamp)
+        self.assertLess(abs((datetime.now() - parsed).total_seconds()), 1.0)
+        self.assertEqual(len(stamp.split(".")[1]), 6)
+
     def test_submit_mission_approved(self):
         # Setup Elder to return APPROVED state
         self.mock_elder_instance.run_mission.return_value = {
@@ -86,5 +161,329 @@ class TestAPI(unittest.TestCase):
         self.assertEqual(data["status"], "STOP_WORK_ORDER")
         self.assertIn("Bad Mission", data["message"])
 
+    def test_submit_mission_shadow_cache_hit(self):
+        # The API must read the same key The Oracle writes
+        import src.api
+        from src.core.oracle import shadow_cache_key
+
+        cached = {
+            "status": "APPROVED",
+            "mission": "Build Password Reset",
+            "verdict": {"status": "APPROVED"},
+            "message": "PRECOGNITION DETECTED"
+        }
+        self.mock_redis_instance.evalsha = AsyncMock(return_value=json.dumps(cached).encode())
+        src.api.redis_client = self.mock_redis_instance
+        response = self.client.post("/missions", json={"mission": "Build Password Reset"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["message"], "PRECOGNITION DETECTED")
+        key = shadow_cache_key("Build Password Reset")
+        self.mock_redis_instance.evalsha.assert_awaited_once()
+        sha, numkeys, *keys, ttl, token = self.mock_redis_instance.evalsha.call_args[0]
+        self.assertEqual((sha, numkeys, keys), (src.api._shadow_lookup.sha, 2, [key, key + b":inflight"]))
+        self.assertEqual(ttl, src.api.SHADOW_INFLIGHT_TTL)
+        self.mock_elder_instance.run_mission.assert_not_called()
+
+    def test_concurrent_identical_mission_waits_for_leader(self):
+        # Another request holds the in-flight marker; this one waits for its result
+        import src.api
+
+        cached = {"status": "APPROVED", "mission": "Build Password Reset", "message": "PRECOGNITION DETECTED"}
+        self.mock_redis_instance.evalsha = AsyncMock(side_effect=[0, 0, json.dumps(cached).encode()])
+        src.api.redis_client = self.mock_redis_instance
+        with patch("src.api.SHADOW_INFLIGHT_POLL_INTERVAL", 0):
+            response = self.client.post("/missions", json={"mission": "Build Password Reset"})
+
+        self.assertEqual(response.json()["message"], "PRECOGNITION DETECTED")
+        self.assertEqual(self.mock_redis_instance.evalsha.await_count, 3)
+        # Polls carry an empty token, so a follower never claims the marker
+        self.assertEqual(self.mock_redis_instance.evalsha.call_args_list[1][0][-1], b"")
+        self.mock_elder_instance.run_mission.assert_not_called()
+
+    def test_follower_runs_unlocked_when_leader_caches_nothing(self):
+        # The leader's mission was refused: marker released (-1), no cache entry.
+        # The follower runs the mission itself instead of queueing behind a new lock.
+        import src.api
+
+        self.mock_elder_instance.run_mission.return_value = {"verdict": None}
+        self.mock_redis_instance.evalsha = AsyncMock(side_effect=[0, -1])
+        src.api.redis_client = self.mock_redis_instance
+        with patch("src.api.SHADOW_INFLIGHT_POLL_INTERVAL", 0):
+            response = self.client.post("/missions", json={"mission": "Build Password Reset"})
+
+        self.assertEqual(response.status_code, 200)
+        self.mock_elder_instance.run_mission.assert_awaited_once()
+        # No claim, so nothing to release
+        self.assertEqual(self.mock_redis_instance.evalsha.await_count, 2)
+
+    def test_inflight_marker_outlives_mission_timeout(self):
+        import src.api
+        self.assertGreater(src.api.SHADOW_INFLIGHT_TTL, src.api.MISSION_TIMEOUT_S)
+
+    def test_leader_releases_inflight_marker(self):
+        # Refused missions are not cached, so followers must be released explicitly
+        import src.api
+        from src.core.oracle import shadow_cache_key
+
+        self.mock_elder_instance.run_mission.return_value = {"verdict": None}
+        src.api.redis_client = self.mock_redis_instance
+        self.client.post("/missions", json={"mission": "Build Password Reset"})
+
+        self.mock_elder_instance.run_mission.assert_awaited_once()
+        claim, release = self.mock_redis_instance.evalsha.call_args_list
+        token = claim[0][-1]
+        self.assertTrue(token)
+        # Compare-and-delete with this request's own token
+        self.assertEqual(
+            release[0],
+            (src.api._shadow_release.sha, 1, shadow_cache_key("Build Password Reset") + b":inflight", token)
+        )
+
+    def test_approved_mission_warms_shadow_cache_in_one_pipeline(self):
+        import src.api
+        from src.core.oracle import shadow_cache_key, SHADOW_CACHE_TTL, ORACLE_STREAM
+
+        self.mock_elder_instance.run_mission.return_value = {
+            "verdict": "APPROVED",
+            "artifact": {"code": "print('ok')"},
+            "test_results": {"status": "PASSED"}
+        }
+        src.api.redis_client = self.mock_redis_instance
+
+        response = self.client.post("/missions", json={"mission": "Write Hello World"})
+
+        self.assertEqual(response.status_code, 200)
+        self.mock_pipeline.execute.assert_awaited_once()
+        key, ttl, payload = self.mock_pipeline.setex.call_args[0]
+        self.assertEqual(key, shadow_cache_key("Write Hello World"))
+        self.assertEqual(ttl, SHADOW_CACHE_TTL)
+        self.assertEqual(json.loads(payload)["status"], "APPROVED")
+        self.mock_pipeline.xadd.assert_called_once()
+        self.assertEqual(self.mock_pipeline.xadd.call_args[0], (ORACLE_STREAM, {"mission": "Write Hello World"}))
+        # The in-flight marker is released after the cache write, in the same pipeline,
+        # and only if it still carries this request's token
+        token = self.mock_redis_instance.evalsha.call_args[0][-1]
+        self.mock_pipeline.eval.assert_called_once_with(
+            src.api.SHADOW_RELEASE_LUA, 1, key + b":inflight", token
+        )
+        self.mock_redis_instance.evalsha.assert_awaited_once()
+
+    def test_oracle_bus_failure_does_not_fail_approved_mission(self):
+        import src.api
+        self.mock_elder_instance.run_mission.return_value = {
+            "verdict": "APPROVED",
+            "artifact": None,
+            "test_results": {"status": "PASSED"}
+        }
+        self.mock_pipeline.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+        src.api.redis_client = self.mock_redis_instance
+
+        response = self.client.post("/missions", json={"mission": "Write Hello World"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "APPROVED")
+
+    def test_submit_mission_times_out_with_504(self):
+        import asyncio
+
+        async def stalled(mission):
+            await asyncio.sleep(10)
+
+        self.mock_elder_instance.run_mission = AsyncMock(side_effect=stalled)
+        with patch("src.api.MISSION_TIMEOUT_S", 0.01):
+            response = self.client.post("/missions", json={"mission": "Write Hello World"})
+
+        self.assertEqual(response.status_code, 504)
+
+    def test_async_mission_returns_task_and_records_result(self):
+        import asyncio
+        import src.api
+
+        self.mock_elder_instance.run_mission.return_value = {
+            "verdict": "APPROVED",
+            "artifact": {"code": "print('ok')"},
+            "test_results": {"status": "PASSED"}
+        }
+
+        # No task store, no background missions
+        src.api.redis_client = None
+        self.assertEqual(self.client.post("/missions/async", json={"mission": "m"}).status_code, 503)
+        src.api.redis_client = self.mock_redis_instance
+
+        with patch("src.api._spawn") as spawn:
+            response = self.client.post("/missions/async", json={"mission": "Write Hello World"})
+            spawn.call_args[0][0].close()  # run it by hand below
+        self.assertEqual(response.status_code, 202)
+        task_id = response.json()["task_id"]
+        self.mock_pipeline.hset.assert_called_once_with(
+            f"mission_task:{task_id}", mapping={"status": "QUEUED", "mission": "Write Hello World"}
+        )
+        self.mock_pipeline.expire.assert_called_once_with(f"mission_task:{task_id}", src.api.MISSION_TASK_TTL)
+
+        asyncio.run(src.api._run_mission_task(task_id, "Write Hello World"))
+        final = self.mock_redis_instance.hset.call_args
+        self.assertEqual(final.kwargs["mapping"]["status"], "DONE")
+        self.assertEqual(json.loads(final.kwargs["mapping"]["result"])["status"], "APPROVED")
+        self.assertIn("stream_callback", self.mock_elder_instance.run_mission.call_args.kwargs)
+
+        self.mock_redis_instance.hgetall = AsyncMock(return_value={
+            b"status": b"DONE", b"phase": b"MISSION_APPROVED", b"result": final.kwargs["mapping"]["result"].encode()
+        })
+        polled = self.client.get(f"/missions/tasks/{task_id}").json()
+        self.assertEqual((polled["status"], polled["phase"]), ("DONE", "MISSION_APPROVED"))
+        self.assertEqual(polled["result"]["artifact"]["code"], "print('ok')")
+
+        self.mock_redis_instance.hgetall = AsyncMock(return_value={})
+        self.assertEqual(self.client.get("/missions/tasks/nope").status_code, 404)
+
+    def test_chronicle_search_streams_envelope(self):
+        cases = [{"case_id": "CASE-1", "verdict": "NULL"}, {"case_id": "CASE-2", "verdict": "AUTHORIZED"}]
+        self.mock_elder_instance.chronicle.retrieve_precedent.return_value = cases
+
+        response = self.client.get("/chronicle/search", params={"q": 'say "hi"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(response.json(), {"query": 'say "hi"', "count": 2, "results": cases})
+
+        self.mock_elder_instance.chronicle.retrieve_precedent.return_value = []
+        self.assertEqual(
+            self.client.get("/chronicle/search", params={"q": "none"}).json(),
+            {"query": "none", "count": 0, "results": []},
+        )
+
+    def test_live_wire_batches_back_to_back_frames(self):
+        # Article 50 frames are emitted together, so they arrive as one batch
+        import src.api
+        src.api.senate = MagicMock()
+
+        with self.client.websocket_connect("/ws/senate") as ws:
+            ws.send_text(json.dumps({"mission": "Deploy now", "allow_ungoverned": True}))
+            frame = json.loads(ws.receive_text())
+
+        self.assertEqual(frame["type"], "batch")
+        self.assertEqual(
+            [e["type"] for e in frame["events"]],
+            ["log", "log", "final_verdict"]
+        )
+        self.assertEqual(frame["events"][-1]["result"], "UNGOVERNED")
+
+    def test_live_wire_accepts_binary_frames(self):
+        import src.api
+        src.api.senate = MagicMock()
+
+        with self.client.websocket_connect("/ws/senate") as ws:
+            ws.send_bytes(json.dumps({"mission": "Deploy now", "allow_ungoverned": True}).encode())
+            frame = json.loads(ws.receive_text())
+
+        self.assertEqual(frame["events"][-1]["result"], "UNGOVERNED")
+
+    def test_live_wire_msgpack_format(self):
+        import msgspec
+        from src.core.senate import Vote
+        import src.api
+        src.api.senate = MagicMock()
+        src.api.senate._onyx_precheck = AsyncMock(return_value=Vote(
+            agent="onyx_precheck", verdict="VETO", reasoning="Surveillance", confidence=0.9
+        ))
+
+        with self.client.websocket_connect("/ws/senate") as ws:
+            ws.send_text(json.dumps({"mission": "Track my neighbours", "format": "msgpack"}))
+            before = msgspec.msgpack.decode(ws.receive_bytes())
+            after = msgspec.msgpack.decode(ws.receive_bytes())
+
+        # Pre-serialized state_change frames are spliced in as MessagePack too
+        self.assertEqual(before["events"][1], {"type": "state_change", "node": "ONYX", "status": "ACTIVE"})
+        self.assertEqual(after["events"][-1]["result"], "VETOED")
+
+    def test_live_wire_runs_full_missions_on_one_connection(self):
+        from src.core.senate import Senate, Vote
+        import src.api
+        src.api.senate = Senate()
+        src.api.senate._onyx_precheck = AsyncMock(return_value=Vote(
+            agent="onyx_precheck", verdict="AUTHORIZE", reasoning="Benign", confidence=0.9
+        ))
+        src.api.senate.brain.think = AsyncMock(return_value={"code": "print('ok')"})
+        src.api.senate._onyx_final = AsyncMock(return_value=Vote(
+            agent="onyx_final", verdict="AUTHORIZE", reasoning="Safe to ship", confidence=0.95
+        ))
+
+        def run_mission(ws, mission):
+            ws.send_text(json.dumps({"mission": mission}))
+            received = []
+            while not received or received[-1]["type"] != "final_verdict":
+                frame = json.loads(ws.receive_text())
+                received.extend(frame["events"] if frame["type"] == "batch" else [frame])
+            return received
+
+        # The channel (and its frame queue) is reused across missions
+        with self.client.websocket_connect("/ws/senate") as ws:
+            first = run_mission(ws, "Write Hello World")
+            second = run_mission(ws, "Write Goodbye World")
+
+        for received in (first, second):
+            types = [e["type"] for e in received]
+            self.assertEqual(types.count("final_verdict"), 1)
+            self.assertEqual(received[-2], {"type": "artifact", "code": "print('ok')", "verdict": "AUTHORIZED"})
+            self.assertEqual(received[-1]["result"], "AUTHORIZED")
+        self.assertEqual(first[0]["message"], "Mission intent received: Write Hello World...")
+        self.assertEqual(second[0]["message"], "Mission intent received: Write Goodbye World...")
+
+    def test_live_wire_rejects_malformed_requests(self):
+        import src.api
+        src.api.senate = MagicMock()
+
+        with self.client.websocket_connect("/ws/senate") as ws:
+            ws.send_text("{not json")
+            bad_json = json.loads(ws.receive_text())
+            ws.send_text(json.dumps({"mission": 42}))
+            bad_shape = json.loads(ws.receive_text())
+            ws.send_text(json.dumps({"allow_ungoverned": False}))
+            missing = json.loads(ws.receive_text())
+
+        self.assertEqual(bad_json, {"type": "error", "message": "Invalid JSON format"})
+        self.assertEqual(bad_shape["type"], "error")
+        self.assertIn("mission", bad_shape["message"])
+        self.assertEqual(missing, {"type": "error", "message": "Mission field required"})
+
+    def test_live_wire_flushes_before_each_senate_call(self):
+        from src.core.senate import Vote
+        import src.api
+        src.api.senate = MagicMock()
+        src.api.senate._onyx_precheck = AsyncMock(return_value=Vote(
+            agent="onyx_precheck", verdict="VETO", reasoning="Surveillance", confidence=0.9
+        ))
+
+        with self.client.websocket_connect("/ws/senate") as ws:
+            ws.send_text(json.dumps({"mission": "Track my neighbours"}))
+            before = json.loads(ws.receive_text())
+            after = json.loads(ws.receive_text())
+
+        # Acknowledge + Onyx activation go out before the pre-check runs
+        self.assertEqual(
+            [e["type"] for e in before["events"]],
+            ["log", "state_change", "log"]
+        )
+        self.assertEqual(after["events"][-1]["type"], "final_verdict")
+        self.assertEqual(after["events"][-1]["result"], "VETOED")
+
+    def test_live_wire_reports_stalled_deliberation(self):
+        import asyncio
+        import src.api
+
+        async def stalled(mission):
+            await asyncio.sleep(10)
+
+        src.api.senate = MagicMock()
+        src.api.senate._onyx_precheck = AsyncMock(side_effect=stalled)
+
+        with patch("src.api.MISSION_TIMEOUT_S", 0.01), \
+             self.client.websocket_connect("/ws/senate") as ws:
+            ws.send_text(json.dumps({"mission": "Write Hello World"}))
+            ws.receive_text()  # Acknowledge + Onyx activation
+            frame = json.loads(ws.receive_text())
+
+        self.assertEqual(frame, {"type": "error", "message": "Deliberation timed out"})
+
 if __name__ == '__main__':
     unittest.main()
@@ -314,6 +314,27 @@ class TestElderAppealIntegration:
         
         assert hasattr(elder, '_build_appeal_mission')
         assert callable(elder._build_appeal_mission)
+    
+    def test_appeal_mission_appends_compact_context(self):
+        """The appeal mission keeps the original case and appends the new context on one line each."""
+        from src.core.elder import TheElder
+        
+        elder = TheElder()
+        mission = elder._build_appeal_mission(
+            original_question="Delete logs",
+            original_deliberation=[{"agent": "onyx", "verdict": "VETO", "reasoning": "x" * 150}],
+            original_ruling="REFUSED",
+            expanded_context={"scope": "tmp only", "retention": 7},
+            constraint_changes={"dry_run": True},
+            appellant_reason=""
+        )
+        
+        lines = mission.split("\n")
+        assert "Original Question: Delete logs" in lines
+        assert f"  onyx: VETO - {'x' * 100}" in lines
+        assert '{"scope":"tmp only","retention":7}' in lines
+        assert '{"dry_run":true}' in lines
+        assert "(No reason provided)" in lines
 
 
 # =============================================================================
@@ -3,6 +3,27 @@ from unittest.mock import MagicMock, patch
 import os
 from src.core.brain import Brain
 
+class _FakeStream:
+    """Stands in for the SDK's AsyncStream: yields delta chunks, records close()."""
+
+    def __init__(self, *deltas):
+        self.deltas = deltas
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        for delta in self.deltas:
+            self.sent += 1
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=delta))])
+
+    async def close(self):
+        self.closed = True
+
+def _streaming(*deltas):
+    """A completions.create mock returning a fresh stream per call."""
+    from unittest.mock import AsyncMock
+    return AsyncMock(side_effect=lambda **kwargs: _FakeStream(*deltas))
+
 class TestBrainRouting(unittest.IsolatedAsyncioTestCase):
 
     async def test_brain_initialization_defaults(self):
@@ -26,6 +47,152 @@ class TestBrainRouting(unittest.IsolatedAsyncioTestCase):
                 self.assertEqual(brain.models["deep"], "deep-model-v1")
                 self.assertEqual(brain.models["fast"], "fast-model-v1")
 
+    async def test_brains_share_one_connection_pool(self):
+        """Every Brain's clients ride the same httpx pool."""
+        from src.core import brain as brain_module
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "fake-key"}):
+            with patch("src.core.brain.AsyncOpenAI") as mock_openai:
+                Brain()
+                Brain()
+        pools = {c.kwargs["http_client"] for c in mock_openai.call_args_list}
+        self.assertEqual(len(pools), 1)
+        self.assertEqual(mock_openai.call_count, 4)  # cloud + local, twice
+
+        await brain_module.close_http_client()
+        self.assertIsNone(brain_module._HTTP_CLIENT)
+
+    async def test_sdk_without_pool_classes_keeps_real_clients(self):
+        """An SDK lacking the Default*Client helpers must not drop the Brain into mock mode."""
+        import httpx
+        from src.core import brain as brain_module
+
+        await brain_module.close_http_client()
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "fake-key"}), \
+             patch("src.core.brain.DefaultAsyncHttpxClient", None), \
+             patch("src.core.brain.DefaultAioHttpClient", None), \
+             patch("src.core.brain.AsyncOpenAI") as mock_openai:
+            brain = Brain()
+        self.assertIs(brain.cloud_client, mock_openai.return_value)
+        pool = mock_openai.call_args.kwargs["http_client"]
+        self.assertIsInstance(pool, httpx.AsyncClient)
+        await brain_module.close_http_client()
+
+    async def test_agents_share_one_brain(self):
+        """get_brain() hands every agent the same Brain."""
+        from src.core.brain import get_brain
+        from src.core.dragons import Ignis, Hydra, Onyx
+
+        self.assertIs(get_brain(), get_brain())
+        self.assertTrue(Ignis().brain is Hydra().brain is Onyx().brain is get_brain())
+
+    async def test_fast_transport_selects_aiohttp_pool(self):
+        """NEST_FAST_TRANSPORT=1 builds the shared pool on aiohttp."""
+        from src.core import brain as brain_module
+
+        await brain_module.close_http_client()
+        with patch.dict(os.environ, {"NEST_FAST_TRANSPORT": "1"}), \
+             patch("src.core.brain._aiohttp_available", return_value=True), \
+             patch("src.core.brain.DefaultAioHttpClient") as mock_aiohttp:
+            client = brain_module._shared_http_client()
+        self.assertIs(client, mock_aiohttp.return_value)
+        mock_aiohttp.assert_called_once_with(limits=brain_module._HTTP_LIMITS)
+        brain_module._HTTP_CLIENT = None
+
+    async def test_fast_transport_without_aiohttp_falls_back_to_httpx(self):
+        """A missing aiohttp extra logs a warning and keeps the httpx pool."""
+        from src.core import brain as brain_module
+
+        await brain_module.close_http_client()
+        with patch.dict(os.environ, {"NEST_FAST_TRANSPORT": "1"}), \
+             patch("src.core.brain.importlib.util.find_spec", return_value=None), \
+             patch("src.core.brain.DefaultAioHttpClient") as mock_aiohttp, \
+             self.assertLogs("TheNest.Brain", level="WARNING"):
+            client = brain_module._shared_http_client()
+        mock_aiohttp.assert_not_called()
+        self.assertIsNotNone(client)
+        await brain_module.close_http_client()
+
+    async def test_think_decodes_object_replies_only(self):
+        """JSON objects are returned as dicts; anything else takes the raw fallback."""
+        brain = Brain()
+        client = MagicMock()
+        brain.cloud_client = client
+        brain.local_client = client
+
+        def reply(content):
+            client.chat.completions.create = _streaming(content)
+
+        reply('{"code": "print(1)", "explanation": "prints"}')
+        self.assertEqual((await brain.think("sys", "user"))["code"], "print(1)")
+
+        for content in ('["not", "an", "object"]', "Sure! Here is the code:"):
+            reply(content)
+            result = await brain.think("sys", "user")
+            self.assertEqual(result["status"], "UNKNOWN_FORMAT")
+            self.assertEqual(result["raw_output"], content)
+
+    async def test_think_stops_reading_when_object_closes(self):
+        """The stream is closed as soon as the top-level object decodes."""
+        from unittest.mock import AsyncMock
+
+        brain = Brain()
+        client = MagicMock()
+        brain.cloud_client = client
+        brain.local_client = client
+        stream = _FakeStream('{"code": "d = {', "'k': 1}", '", "ir": "\\"}\\""}', "\n\n", "  ")
+        client.chat.completions.create = AsyncMock(return_value=stream)
+
+        result = await brain.think("sys", "user")
+        self.assertEqual(result, {"code": "d = {'k': 1}", "ir": '"}"'})
+        self.assertEqual(client.chat.completions.create.call_args.kwargs["stream"], True)
+        self.assertEqual(stream.sent, 3)
+        self.assertTrue(stream.closed)
+
+        # Braces in a prose preamble don't end the read early
+        client.chat.completions.create = _streaming("Sure {ok}", ' {"vote": "NULL"}')
+        self.assertEqual((await brain.think("sys", "user"))["status"], "UNKNOWN_FORMAT")
+
+    async def test_mock_response_dispatch(self):
+        """Keyword dispatch keeps agent names case-sensitive and topics case-insensitive."""
+        brain = Brain()
+        cases = {
+            "MISSION: HACK the mainframe": "MOCK_REFUSAL_DUE_TO_KEYWORD",
+            "Write a Python sorter": "code",
+            "ignis, sort a list": "UNKNOWN_MOCK",
+            "Onyx: review Surveillance plan": "MOCK_REFUSAL_DUE_TO_KEYWORD",
+            "Please AUDIT this": "MOCK_AUTHORIZATION_SAFE",
+            "Hydra, attack it": "MOCK_TEST_PASS",
+            "hello": "UNKNOWN_MOCK",
+        }
+        for prompt, expected in cases.items():
+            result = brain._mock_response(prompt)
+            if expected == "code":
+                self.assertIn("code", result, prompt)
+            else:
+                self.assertIn(expected, (result.get("reason"), result.get("status")), prompt)
+
+    async def test_think_memoizes_greedy_replies_only(self):
+        """Temperature 0.0 calls hit the reply cache; sampled calls, Onyx votes included, always go out."""
+        brain = Brain()
+        client = MagicMock()
+        brain.cloud_client = client
+        brain.local_client = client
+        client.chat.completions.create = _streaming('{"vote": "AUTHORIZE"}')
+
+        first = await brain.think("sys", "classify", temperature=0.0)
+        first["vote"] = "MUTATED"
+        second = await brain.think("sys", "classify", temperature=0.0)
+        self.assertEqual(second, {"vote": "AUTHORIZE"})
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+        self.assertEqual(client.chat.completions.create.call_args.kwargs["temperature"], 0.0)
+
+        await brain.think("sys", "audit", agent="onyx")  # governance temperature 0.1
+        await brain.think("sys", "audit", agent="onyx")
+        await brain.think("sys", "audit")  # default creative temperature
+        await brain.think("sys", "audit")
+        self.assertEqual(client.chat.completions.create.call_count, 5)
+
     async def test_think_routing_default(self):
         """Test that think() uses the correct default models based on agent."""
         brain = Brain()
@@ -372,6 +372,31 @@ class TestNullVerdictDurability:
         assert stored.question == "rm -rf /"
         assert stored.verdict["ruling"] == "NULL_VERDICT"
         assert stored.verdict["nulling_agents"] == ["ONYX"]
+        
+        # Refusals share the immutable placeholder vector instead of allocating one
+        from src.memory.schema import ZERO_CONTEXT_VECTOR
+        assert stored.context_vector is ZERO_CONTEXT_VECTOR
+    
+    def test_null_verdict_survives_reload(self, tmp_path):
+        """A persisted NullVerdict is read back intact by a fresh Chronicle."""
+        from src.memory.chronicle import TheChronicle
+        from src.memory.schema import NullVerdictRecord
+        
+        path = str(tmp_path / "chronicle.json")
+        chronicle = TheChronicle(persistence_path=path)
+        record = NullVerdictRecord.create(
+            mission="rm -rf /",
+            nulling_agents=["ONYX"],
+            reason_codes=["SYSTEM_DESTRUCTION"],
+            context_summary="System destruction attempt"
+        )
+        chronicle.persist_null_verdict(record, chronicle.get_writer_handle("ELDER"))
+        
+        reloaded = TheChronicle(persistence_path=path)
+        stored = reloaded.get_case_by_id(record.case_id)
+        assert stored is not None
+        assert stored.verdict["ruling"] == "NULL_VERDICT"
+        assert stored.verdict["nulling_agents"] == ["ONYX"]
     
     # =========================================================================
     # TEST 5: Elder._persist_null_verdict method exists
@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch, AsyncMock
 import os
 import hashlib
-from src.core.dragons import Ignis, Hydra, Onyx, RosettaArtifact
+from src.core.dragons import Ignis, Hydra, Onyx, RosettaArtifact, sign_rosetta
 from src.core.constitution import VoteType
 
 class TestDragonsCrucible(unittest.IsolatedAsyncioTestCase):
@@ -18,7 +18,7 @@ class TestDragonsCrucible(unittest.IsolatedAsyncioTestCase):
             "selected_signature": "mock_sig"
         }
 
-    @patch("src.core.dragons.Brain")
+    @patch("src.core.dragons.get_brain")
     async def test_ignis_forge_variants(self, MockBrain):
         """Ignis should forge 3 variants (SPEED, SAFETY, CLARITY)."""
         # Setup Environment and Mock
@@ -44,7 +44,36 @@ class TestDragonsCrucible(unittest.IsolatedAsyncioTestCase):
             call_args = mock_brain_instance.think.call_args
             self.assertEqual(call_args.kwargs['model'], "ignis-model-v2")
 
-    @patch("src.core.dragons.Brain")
+    @patch("src.core.dragons.get_brain")
+    async def test_ignis_forge_variants_runs_concurrently(self, MockBrain):
+        """All three strategies are in flight at once; a failed one is dropped."""
+        import asyncio
+
+        ignis = Ignis()
+        started = []
+        release = asyncio.Event()
+
+        async def think(system_prompt, user_prompt, **kwargs):
+            started.append(system_prompt)
+            if len(started) == 3:
+                release.set()
+            await release.wait()
+            if "SAFETY PROTOCOL" in system_prompt:
+                raise RuntimeError("forge cracked")
+            return self.mock_brain_response
+
+        MockBrain.return_value.think = think
+
+        variants = await asyncio.wait_for(ignis.forge_variants("Mission", [], []), timeout=1)
+
+        self.assertEqual(len(started), 3)
+        self.assertEqual(
+            [v.intermediate_representation.split("]")[0] for v in variants],
+            ["[SPEED", "[CLARITY"]
+        )
+        self.assertTrue(all(v.verify() for v in variants))
+
+    @patch("src.core.dragons.get_brain")
     async def test_hydra_inject_venom(self, MockBrain):
         """Hydra should check integrity and run tests."""
         with patch.dict(os.environ, {"HYDRA_MODEL": "hydra-model-v2"}):
@@ -57,7 +86,7 @@ class TestDragonsCrucible(unittest.IsolatedAsyncioTestCase):
             # Create a valid artifact
             valid_code = "print('safe')"
             valid_ir = "safe logic"
-            sig = hashlib.sha256((valid_code + valid_ir).encode()).hexdigest()
+            sig = sign_rosetta(valid_code, valid_ir)
             artifact = RosettaArtifact(valid_code, valid_ir, sig)
             
             # Run Venom
@@ -69,7 +98,26 @@ class TestDragonsCrucible(unittest.IsolatedAsyncioTestCase):
             call_args = mock_brain_instance.think.call_args
             self.assertEqual(call_args.kwargs['model'], "hydra-model-v2")
 
-    @patch("src.core.dragons.Brain")
+    def test_rosetta_signature_is_blake2b(self):
+        """Signatures are BLAKE2b-256 hex digests; any edit breaks verify()."""
+        sig = sign_rosetta("print(1)", "prints one")
+        self.assertEqual(sig, hashlib.blake2b(b"print(1)\0prints one", digest_size=32).hexdigest())
+        # The boundary between code and IR is part of what is signed
+        self.assertNotEqual(sign_rosetta("ab", "c"), sign_rosetta("a", "bc"))
+        self.assertTrue(RosettaArtifact("print(1)", "prints one", sig).verify())
+        self.assertFalse(RosettaArtifact("print(2)", "prints one", sig).verify())
+
+    def test_rosetta_verify_hashes_once(self):
+        """Artifacts are frozen, so repeat verify() calls reuse the first digest."""
+        artifact = RosettaArtifact("code", "ir", sign_rosetta("code", "ir"))
+        with patch("src.core.dragons.sign_rosetta", wraps=sign_rosetta) as signer:
+            self.assertTrue(artifact.verify())
+            self.assertTrue(artifact.verify())
+        signer.assert_called_once()
+        with self.assertRaises(AttributeError):
+            artifact.code = "tampered"
+
+    @patch("src.core.dragons.get_brain")
     async def test_onyx_select_champion(self, MockBrain):
         """Onyx should select a champion from candidates."""
         with patch.dict(os.environ, {"ONYX_MODEL": "onyx-model-v2"}):
@@ -91,9 +139,73 @@ class TestDragonsCrucible(unittest.IsolatedAsyncioTestCase):
             champion = await onyx.select_champion(candidates, test_results)
             
             self.assertEqual(champion.signature, "sig3")
+
+            # Candidates reach the Arbiter as a JSON table with full signatures
+            import json
+            user_prompt = mock_brain_instance.think.call_args.args[1]
+            table = json.loads(user_prompt.split("CANDIDATES:", 1)[1].split("Select the Champion.")[0])
+            self.assertEqual([row["signature"] for row in table], ["sig1", "sig2", "sig3"])
+            self.assertEqual(table[1]["test_status"], {"status": "FAILED"})
              # Verify Brain model usage
             call_args = mock_brain_instance.think.call_args
             self.assertEqual(call_args.kwargs['model'], "onyx-model-v2")
 
+    def test_vote_enums_are_plain_strings_on_the_wire(self):
+        """VoteType/AgentRole compare equal to their values and encode without .value."""
+        import orjson
+        from src.core.constitution import AgentRole
+
+        self.assertEqual(VoteType.AUTHORIZE, "AUTHORIZED")
+        self.assertEqual(AgentRole.ONYX, "ONYX")
+        self.assertEqual(
+            orjson.loads(orjson.dumps({"vote": VoteType.NULL, "role": AgentRole.HYDRA})),
+            {"vote": "NULL", "role": "HYDRA"}
+        )
+
+    @patch("src.core.dragons.get_brain")
+    async def test_onyx_intent_hard_filter(self, MockBrain):
+        """A keyword hit refuses in any case, before the LLM is consulted."""
+        onyx = Onyx()
+        MockBrain.return_value.think = AsyncMock(return_value={"vote": "AUTHORIZE"})
+
+        result = await onyx.audit("Then RM -RF the logs")
+        self.assertEqual(result["vote"], VoteType.NULL)
+        self.assertEqual(result["reason"], "FORBIDDEN_KEYWORD_DETECTED: RM -RF")
+        MockBrain.return_value.think.assert_not_awaited()
+
+        result = await onyx.audit("Sort a list of integers")
+        self.assertEqual(result["vote"], VoteType.AUTHORIZE)
+
+    @patch("src.core.dragons.get_brain")
+    async def test_crucible_batch_review_is_one_call_each(self, MockBrain):
+        """Hydra and Onyx review all candidates in one call each, keyed by signature."""
+        good = [RosettaArtifact(f"c{i}", f"ir{i}", sign_rosetta(f"c{i}", f"ir{i}")) for i in range(3)]
+        forged = RosettaArtifact("evil", "ir", "not-a-signature")
+
+        think = AsyncMock(return_value={
+            "CANDIDATE_A": {"status": "PASSED", "vote": "AUTHORIZE"},
+            "CANDIDATE_B": {"status": "FAILED", "reason": "Off by one", "vote": "NULL"},
+            # CANDIDATE_C left out: Hydra defaults to PASSED, Onyx to NULL
+        })
+        MockBrain.return_value.think = think
+
+        tests = await Hydra().batch_inject(good + [forged], "Sort numbers")
+        self.assertEqual(think.await_count, 1)
+        self.assertEqual(tests[good[0].signature]["status"], "PASSED")
+        self.assertEqual(tests[good[1].signature]["reason"], "Off by one")
+        self.assertEqual(tests[good[2].signature]["status"], "PASSED")
+        self.assertEqual(tests[forged.signature]["reason"], "ROSETTA_MISMATCH")
+        self.assertNotIn("evil", think.call_args.args[1])
+
+        audits = await Onyx().batch_audit(good + [forged])
+        self.assertEqual(think.await_count, 2)
+        self.assertEqual(audits[good[0].signature]["vote"], VoteType.AUTHORIZE)
+        self.assertEqual(audits[good[1].signature]["vote"], VoteType.NULL)
+        self.assertEqual(audits[good[2].signature]["vote"], VoteType.NULL)
+        self.assertEqual(audits[forged.signature]["reason"], "INTEGRITY_FAILURE")
+
+        tests = await Hydra().batch_inject(good, "Build a surveillance dashboard")
+        self.assertEqual(tests[good[0].signature]["reason"], "PRIVACY_LEAK")
+
 if __name__ == '__main__':
     unittest.main()
@@ -58,6 +58,173 @@ class TestTheElder(unittest.IsolatedAsyncioTestCase):
         # Verdict should be a NullVerdictState object or dict
         self.assertIn("mission", result)
 
+    @patch.object(Senate, 'convene')
+    async def test_unobserved_shadow_refusal_skips_vote_dump(self, mock_convene):
+        """Shadow runs nobody listens to skip serializing votes and persist nothing."""
+        mock_convene.return_value = SenateRecord(
+            state=SenateState.NULL_VERDICT,
+            intent="Delete all files",
+            votes=[Vote(agent="onyx_precheck", verdict="VETO", reasoning="Dangerous", confidence=1.0)]
+        )
+
+        with patch.object(Vote, "model_dump") as dump:
+            result = await self.elder.run_mission("Delete all files", shadow_mode=True)
+        dump.assert_not_called()
+        self.assertEqual(result["votes"], [])
+        self.assertEqual(result["verdict"].context_summary, "Dangerous")
+        self.chronicle.persist_null_verdict.assert_not_called()
+
+    async def test_run_batch_async_bounds_concurrency_and_keeps_order(self):
+        """Batch missions overlap up to the limit; results and failures stay in input order."""
+        import asyncio
+        from src.memory.chronicle import ChroniclePersistenceError
+
+        in_flight = 0
+        peak = 0
+
+        async def convene(intent, allow_ungoverned=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if intent == "refuse":
+                return SenateRecord(
+                    state=SenateState.NULL_VERDICT,
+                    intent=intent,
+                    votes=[Vote(agent="onyx_precheck", verdict="VETO", reasoning="No", confidence=1.0)]
+                )
+            return SenateRecord(state=SenateState.AUTHORIZED, intent=intent)
+
+        self.chronicle.persist_null_verdict.side_effect = ChroniclePersistenceError("NULL-TEST", "disk full")
+        missions = ["a", "b", "refuse", "c", "d"]
+        with patch.object(Senate, "convene", side_effect=convene):
+            results = await self.elder.run_batch_async(missions, max_concurrency=2)
+
+        self.assertEqual(peak, 2)
+        self.assertIsInstance(results[2], ChroniclePersistenceError)
+        self.assertEqual([r["mission"] for i, r in enumerate(results) if i != 2], ["a", "b", "c", "d"])
+        await self.elder.close()
+        written = [p for call in self.chronicle.log_precedent_batch.call_args_list for p in call.args[0]]
+        self.assertEqual(len(written), 4)
+
+    async def test_approved_cases_are_written_in_batches(self):
+        """A burst of approvals reaches the Chronicle as one batched write."""
+        import asyncio
+
+        async def convene(intent, allow_ungoverned=False):
+            return SenateRecord(state=SenateState.AUTHORIZED, intent=intent)
+
+        with patch.object(Senate, "convene", side_effect=convene):
+            await asyncio.gather(*(self.elder.run_mission(f"m{i}") for i in range(5)))
+        await self.elder.close()
+
+        self.chronicle.log_precedent.assert_not_called()
+        self.chronicle.log_precedent_batch.assert_called_once()
+        batch = self.chronicle.log_precedent_batch.call_args.args[0]
+        self.assertEqual([p.question for p in batch], [f"m{i}" for i in range(5)])
+        # Shared immutable placeholder vector; case IDs stay unique and hyphen-free after the date
+        self.assertTrue(all(p.context_vector is batch[0].context_vector for p in batch))
+        self.assertEqual(len({p.case_id for p in batch}), 5)
+        self.assertRegex(batch[0].case_id, r"^CASE-\d{4}-\d{2}-\d{2}-[0-9a-f]{8}$")
+        self.assertEqual(self.chronicle.log_precedent_batch.call_args.kwargs["handle"],
+                         self.elder._chronicle_write_handle)
+
+    async def test_write_batch_flushes_when_full_without_waiting(self):
+        """Batch size and wait come from the environment; a full batch skips the wait."""
+        import asyncio
+
+        with patch.dict("os.environ", {"CHRONICLE_BATCH_MAX": "3", "CHRONICLE_BATCH_WAIT_S": "30"}):
+            elder = TheElder(chronicle=self.chronicle)
+        self.assertEqual((elder._write_queue.max_batch, elder._write_queue.max_wait), (3, 30.0))
+
+        async def convene(intent, allow_ungoverned=False):
+            return SenateRecord(state=SenateState.AUTHORIZED, intent=intent)
+
+        with patch.object(Senate, "convene", side_effect=convene):
+            await asyncio.gather(*(elder.run_mission(f"m{i}") for i in range(3)))
+        await asyncio.wait_for(elder._write_queue.flush(), timeout=1)
+        self.chronicle.log_precedent_batch.assert_called_once()
+        await elder.close()
+
+    async def test_stream_callback_does_not_block_senate(self):
+        """A slow UI sink runs alongside the Senate; events stay ordered and sync sinks work."""
+        import asyncio
+        import threading
+
+        convened = asyncio.Event()
+
+        async def convene(intent, allow_ungoverned=False):
+            convened.set()
+            return SenateRecord(state=SenateState.AUTHORIZED, intent=intent, ignis_proposal="print(1)")
+
+        events = []
+
+        async def slow_sink(event, data):
+            if event == "SENATE_CONVENING":
+                # The Senate convenes while the first event is still being delivered
+                await asyncio.wait_for(convened.wait(), timeout=1)
+            events.append(event)
+
+        with patch.object(Senate, "convene", side_effect=convene):
+            await self.elder.run_mission("m", stream_callback=slow_sink, shadow_mode=True)
+        self.assertEqual(events, ["SENATE_CONVENING", "IGNIS_FORGE_COMPLETE", "MISSION_APPROVED"])
+
+        sink_threads = []
+        with patch.object(Senate, "convene", side_effect=convene):
+            await self.elder.run_mission(
+                "m", stream_callback=lambda event, data: sink_threads.append(threading.current_thread()),
+                shadow_mode=True
+            )
+        self.assertEqual(len(sink_threads), 3)
+        self.assertNotIn(threading.main_thread(), sink_threads)
+
+    @patch.object(Senate, 'convene')
+    async def test_null_verdict_persisted_off_loop_and_fails_closed(self, mock_convene):
+        """The NullVerdict write runs on a worker thread; its failure still reaches the caller."""
+        import threading
+        from src.memory.chronicle import ChroniclePersistenceError
+
+        mock_convene.return_value = SenateRecord(
+            state=SenateState.NULL_VERDICT,
+            intent="Delete all files",
+            votes=[Vote(agent="onyx_precheck", verdict="VETO", reasoning="Dangerous", confidence=1.0)]
+        )
+        writer_threads = []
+        self.chronicle.persist_null_verdict.side_effect = lambda **kw: writer_threads.append(threading.current_thread())
+
+        await self.elder.run_mission("Delete all files")
+        self.assertIsNot(writer_threads[0], threading.main_thread())
+
+        self.chronicle.persist_null_verdict.side_effect = ChroniclePersistenceError("NULL-TEST", "disk full")
+        with self.assertRaises(ChroniclePersistenceError):
+            await self.elder.run_mission("Delete all files")
+
+    @patch.object(Senate, 'convene')
+    async def test_refusal_event_follows_durable_null_verdict(self, mock_convene):
+        """MISSION_REFUSED reaches the UI only after the NullVerdict write succeeded."""
+        from src.memory.chronicle import ChroniclePersistenceError
+
+        mock_convene.return_value = SenateRecord(
+            state=SenateState.NULL_VERDICT,
+            intent="Delete all files",
+            votes=[Vote(agent="onyx_precheck", verdict="VETO", reasoning="Dangerous", confidence=1.0)]
+        )
+        timeline = []
+        self.chronicle.persist_null_verdict.side_effect = lambda **kw: timeline.append("persisted")
+
+        async def sink(event, data):
+            timeline.append(event)
+
+        await self.elder.run_mission("Delete all files", stream_callback=sink)
+        self.assertLess(timeline.index("persisted"), timeline.index("MISSION_REFUSED"))
+
+        timeline.clear()
+        self.chronicle.persist_null_verdict.side_effect = ChroniclePersistenceError("NULL-TEST", "disk full")
+        with self.assertRaises(ChroniclePersistenceError):
+            await self.elder.run_mission("Delete all files", stream_callback=sink)
+        self.assertNotIn("MISSION_REFUSED", timeline)
+
     async def test_invoke_article_50(self):
         """Test Martial Governance Protocol (UNGOVERNED mode)."""
         with patch("src.core.elder.UngovernedSigner") as MockSigner:
@@ -73,6 +240,17 @@ class TestTheElder(unittest.IsolatedAsyncioTestCase):
             call_arg = self.chronicle.log_precedent.call_args[0][0]
             self.assertEqual(call_arg.verdict['ruling'], "UNGOVERNED")
 
+            # Each invocation gets its own watermark and history built from the shared template
+            watermark = result["artifact"]["watermark"]
+            self.assertEqual(watermark["zone"], "UNGOVERNED")
+            self.assertEqual(watermark["case_id"], call_arg.case_id)
+            self.assertIs(call_arg.verdict["watermark"], watermark)
+            watermark["zone"] = "TAMPERED"
+            result["history"].append("TAMPERED")
+            again = self.elder.invoke_article_50("Execute Order 67")
+            self.assertEqual(again["artifact"]["watermark"]["zone"], "UNGOVERNED")
+            self.assertNotIn("TAMPERED", again["history"])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -298,5 +298,29 @@ class TestFindingDeduplication:
         assert len(findings) <= 3  # Could be 1-3 depending on excerpts
 
 
+class TestHydraContext:
+    """Test the findings block handed to Onyx Final."""
+    
+    def setup_method(self):
+        self.senate = Senate()
+    
+    def test_no_findings_returns_report(self):
+        assert self.senate._build_hydra_context("All clear.", []) == "All clear."
+        assert self.senate._build_hydra_context(None, []) == "No critical findings."
+    
+    def test_findings_are_numbered(self):
+        findings = [
+            HydraFinding(pattern_matched="sql injection", excerpt="...", severity="CRITICAL"),
+            HydraFinding(pattern_matched="xss", excerpt="...", severity="HIGH"),
+        ]
+        context = self.senate._build_hydra_context("Report.", findings)
+        
+        assert context == (
+            "Report.\n\n⚠️ BINDING FINDINGS REQUIRING ACKNOWLEDGMENT:\n"
+            "  1. [CRITICAL] sql injection\n"
+            "  2. [HIGH] xss\n"
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,154 @@
+"""
+Tests for The Oracle (Predictive Shadow Builds)
+"""
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.oracle import (
+    TheOracle, prediction_key, shadow_cache_key, PREDICTION_TTL, ORACLE_STREAM, ORACLE_GROUP,
+    ORACLE_DEAD_LETTER, ORACLE_MAX_DELIVERIES
+)
+
+
+class TestOraclePrediction(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        with patch("src.core.oracle.redis.from_url") as from_url, \
+             patch("src.core.oracle.TheChronicle"), \
+             patch("src.core.oracle.get_brain") as get_brain:
+            self.redis = AsyncMock()
+            from_url.return_value = self.redis
+            get_brain.return_value = MagicMock(think=AsyncMock(return_value={"prediction": "Build Password Reset"}))
+            self.oracle = TheOracle()
+        self.oracle.elder.run_mission = AsyncMock(return_value={"verdict": "REFUSED"})
+
+    async def test_known_mission_skips_the_brain(self):
+        """A remembered prediction is reused without another LLM call."""
+        stored = {prediction_key("Build Login"): b"Build Password Reset"}
+        self.redis.get.side_effect = lambda key: stored.get(key)
+
+        await self.oracle.prophesy("Build Login")
+
+        self.oracle.brain.think.assert_not_awaited()
+        self.oracle.elder.run_mission.assert_awaited_once_with("Build Password Reset", shadow_mode=True)
+
+    async def test_new_mission_remembers_the_prediction(self):
+        """A fresh prediction is stored once, without overwriting a concurrent one."""
+        self.redis.get.return_value = None
+
+        await self.oracle.prophesy("Build Login")
+
+        self.oracle.brain.think.assert_awaited_once()
+        self.redis.set.assert_any_await(
+            prediction_key("Build Login"), "Build Password Reset", ex=PREDICTION_TTL, nx=True
+        )
+        self.redis.get.assert_any_await(shadow_cache_key("Build Password Reset"))
+
+
+class TestOracleRoar(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        with patch("src.core.oracle.redis.from_url") as from_url, \
+             patch("src.core.oracle.TheChronicle"), \
+             patch("src.core.oracle.get_brain"):
+            self.redis = AsyncMock()
+            from_url.return_value = self.redis
+            self.oracle = TheOracle()
+
+    async def test_batch_runs_concurrently_and_acks_only_completed(self):
+        """A Roar batch is prophesied in parallel up to the cap; failures stay pending."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def prophesy(mission):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if mission == "boom":
+                raise RuntimeError("Brain unavailable")
+
+        self.oracle.prophesy = prophesy
+        entries = [(f"1-{i}".encode(), {b"mission": f"m{i}".encode()}) for i in range(4)]
+        entries.append((b"1-4", {b"mission": b"boom"}))
+        entries.append((b"1-5", None))  # Trimmed from the stream before replay
+
+        await self.oracle._prophesy_batch(entries, asyncio.Semaphore(3))
+
+        self.assertEqual(peak, 3)
+        self.redis.xack.assert_awaited_once_with(
+            ORACLE_STREAM, ORACLE_GROUP, b"1-0", b"1-1", b"1-2", b"1-3", b"1-5"
+        )
+
+    async def test_restarted_oracle_replays_pending_entries(self):
+        """A restart keeps the consumer name, replays its pending entries once each, then reads new ones."""
+        import asyncio
+
+        with patch("src.core.oracle.redis.from_url", return_value=self.redis), \
+             patch("src.core.oracle.TheChronicle"), \
+             patch("src.core.oracle.get_brain"):
+            restarted = TheOracle()
+        self.assertEqual(restarted.consumer, self.oracle.consumer)
+
+        # Left pending by the previous process: one that will succeed now, one that still fails
+        pending = [(b"1-0", {b"mission": b"m0"}), (b"1-1", {b"mission": b"boom"})]
+
+        async def xreadgroup(group, consumer, streams, count, block):
+            self.assertEqual((group, consumer), (ORACLE_GROUP, restarted.consumer))
+            after = streams[ORACLE_STREAM]
+            if after == ">":
+                return []
+            remaining = [e for e in pending if after == "0" or e[0] > after]
+            return [[ORACLE_STREAM.encode(), remaining]]
+
+        self.redis.xreadgroup.side_effect = xreadgroup
+        prophesied = []
+
+        async def prophesy(mission):
+            prophesied.append(mission)
+            if mission == "boom":
+                raise RuntimeError("Brain unavailable")
+
+        restarted.prophesy = prophesy
+        slots = asyncio.Semaphore(8)
+
+        read_from = await restarted._poll_roar("0", slots)
+        self.assertEqual(read_from, b"1-1")  # Past the failed entry: no tight retry loop
+        self.redis.xack.assert_awaited_once_with(ORACLE_STREAM, ORACLE_GROUP, b"1-0")
+        self.assertEqual(await restarted._poll_roar(read_from, slots), ">")
+        self.assertEqual(prophesied, ["m0", "boom"])
+
+    async def test_reclaim_retries_stale_entries_and_dead_letters_poison(self):
+        """Idle pending entries are claimed and retried; ones past the delivery cap are dead-lettered."""
+        import asyncio
+
+        self.redis.xpending_range.return_value = [
+            {"message_id": b"2-0", "consumer": b"oracle-gone", "time_since_delivered": 90000, "times_delivered": 1},
+            {"message_id": b"2-1", "consumer": b"oracle-gone", "time_since_delivered": 90000,
+             "times_delivered": ORACLE_MAX_DELIVERIES},
+        ]
+        self.redis.xclaim.return_value = [(b"2-0", {b"mission": b"m"}), (b"2-1", {b"mission": b"poison"})]
+        self.oracle.prophesy = AsyncMock()
+
+        await self.oracle._reclaim_stale(asyncio.Semaphore(8))
+
+        self.assertEqual(self.redis.xclaim.call_args.args[2], self.oracle.consumer)
+        self.oracle.prophesy.assert_awaited_once_with("m")
+        self.redis.xadd.assert_awaited_once_with(ORACLE_DEAD_LETTER, {b"mission": b"poison", b"roar_id": b"2-1"})
+        self.redis.xack.assert_any_await(ORACLE_STREAM, ORACLE_GROUP, b"2-1")
+        self.redis.xack.assert_any_await(ORACLE_STREAM, ORACLE_GROUP, b"2-0")
+
+    async def test_joining_an_existing_group_is_not_an_error(self):
+        """Restarted Oracles reuse the consumer group instead of failing."""
+        from redis.exceptions import ResponseError
+
+        self.redis.xgroup_create.side_effect = ResponseError("BUSYGROUP Consumer Group name already exists")
+        await self.oracle._join_roar()
+        self.redis.xgroup_create.assert_awaited_once_with(ORACLE_STREAM, ORACLE_GROUP, id="$", mkstream=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
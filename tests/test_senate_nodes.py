@@ -41,7 +41,7 @@ class TestSenateConvene(unittest.IsolatedAsyncioTestCase):
         self.assertIn("MARTIAL LAW", record.metadata.get("note", ""))
 
     @patch.object(Senate, '_onyx_precheck')
-    @patch('src.core.senate.Brain')
+    @patch('src.core.senate.get_brain')
     @patch.object(Senate, '_onyx_final')
     async def test_full_flow_authorize(self, mock_final, mock_brain_cls, mock_precheck):
         """Test successful authorization flow through all nodes."""